@@ -0,0 +1,152 @@
+import argparse
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from dataclasses import dataclass
+
+from helpers.export_signal_file import export_signal_file
+from helpers.load_signal_file import load_signal_file
+from helpers.spectrum_cache import get_spectrum_cache
+from managers.equalizer import PRECISIONS, Equalizer, set_precision
+from managers.fft_backend import FFT_BACKENDS, set_fft_backend
+from managers.long_file_equalizer import LONG_FILE_BLOCK_SIZE, LONG_FILE_THRESHOLD, LongFileEqualizer
+from models.equalizer_mode import ModeType, WindowType, MODE_LABELS, ABNORMALITIES_BANDS
+from models.equalizer_preset import EqualizerPreset, load_preset
+
+SUPPORTED_EXTENSIONS = ('.wav', '.mp3', '.csv')
+
+
+@dataclass
+class FileReport:
+    # What a worker sends back: only the path it wrote and its timings, never the samples
+    input_path: str
+    output_path: str
+    frames: int
+    duration: float
+    seconds: float
+
+    def __str__(self) -> str:
+        return (f'{self.input_path} -> {self.output_path} ({self.frames} frames in {self.seconds:.2f} s, '
+                f'{self.frames / self.seconds / 1e6:.2f} Mframes/s, {self.duration / self.seconds:.0f}x realtime)')
+
+
+def find_signal_files(input_dir: str) -> list:
+    return sorted(
+        os.path.join(input_dir, file)
+        for file in os.listdir(input_dir)
+        if file.lower().endswith(SUPPORTED_EXTENSIONS)
+    )
+
+
+def get_output_path(file_path: str, output_dir: str) -> str:
+    # Audio is written as wav and csv as csv. The input's extension is kept in the name when it differs
+    # from the output's, so take1.wav and take1.mp3 become take1.wav and take1.mp3.wav.
+    file_name = os.path.basename(file_path)
+    extension = '.csv' if file_name.lower().endswith('.csv') else '.wav'
+    if not file_name.lower().endswith(extension):
+        file_name += extension
+    return os.path.join(output_dir, file_name)
+
+
+def find_output_collisions(files: list, output_dir: str) -> dict:
+    # Output paths that more than one input would be written to, with those inputs
+    inputs_by_output = {}
+    for file_path in files:
+        inputs_by_output.setdefault(os.path.normcase(get_output_path(file_path, output_dir)), []).append(file_path)
+    return {output_path: inputs for output_path, inputs in inputs_by_output.items() if len(inputs) > 1}
+
+
+def init_worker(fft_backend: str, precision: str):
+    # Every process already has a core to itself, threaded FFTs inside them would only oversubscribe the CPU
+    set_fft_backend(fft_backend, threads=1)
+    set_precision(precision)
+    # Every file is equalized once, hashing and caching it would only cost reads, memory and disk writes
+    spectrum_cache = get_spectrum_cache()
+    spectrum_cache.memory_budget = spectrum_cache.disk_budget = 0
+
+
+def equalize_file(file_path: str, output_path: str, preset: EqualizerPreset, pad_to_fast_length: bool = False, long_file: bool = None, block_size: int = LONG_FILE_BLOCK_SIZE) -> FileReport:
+    start = time.perf_counter()
+    signal, file_name = load_signal_file(file_path)
+    bands = preset.get_bands(signal.get_sampling_frequency() / 2, file_name)
+
+    # Long signals are streamed through the block equalizer instead of being transformed whole
+    if long_file is None:
+        long_file = signal.sample_count > LONG_FILE_THRESHOLD
+    if long_file:
+        LongFileEqualizer(signal, bands, preset.window_type, block_size).equalize_to_file(output_path, preset.gains)
+    else:
+        output = Equalizer(signal, bands, preset.mode, preset.window_type, pad_to_fast_length=pad_to_fast_length).equalize(preset.gains)
+        export_signal_file(output, output_path)
+    duration = signal.sample_count / signal.get_sampling_frequency()
+    return FileReport(file_path, output_path, signal.sample_count, duration, time.perf_counter() - start)
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description='Equalize every wav/mp3/csv file of a directory without the GUI.')
+    parser.add_argument('input_dir')
+    parser.add_argument('output_dir')
+    parser.add_argument('--preset', help='JSON preset with "mode", "window", "gains" and "band_table", overrides the flags below')
+    parser.add_argument('--mode', type=ModeType, choices=list(ModeType), default=ModeType.ANIMALS)
+    parser.add_argument('--window', type=WindowType, choices=list(WindowType), default=WindowType.RECTANGLE)
+    parser.add_argument('--gains', type=float, nargs='+', help='one gain per band of the mode, defaults to 1 for every band')
+    parser.add_argument('--band-table', choices=list(ABNORMALITIES_BANDS), help='ECG band table used for every file, instead of picking it by file name')
+    parser.add_argument('--workers', type=int, default=None, help='number of worker processes, defaults to the CPU count')
+    parser.add_argument('--fft-backend', choices=list(FFT_BACKENDS), default='scipy')
+    parser.add_argument('--precision', choices=list(PRECISIONS), default='double', help='single precision halves memory and bandwidth, see SINGLE_PRECISION_TOLERANCE')
+    parser.add_argument('--fast-length', action='store_true', help='zero-pad every transform to a fast FFT length')
+    parser.add_argument('--long-file', action=argparse.BooleanOptionalAction, default=None,
+                        help=f'equalize block by block with bounded memory, by default only files over {LONG_FILE_THRESHOLD} frames')
+    parser.add_argument('--block-size', type=int, default=LONG_FILE_BLOCK_SIZE, help='block size of the long-file mode')
+    args = parser.parse_args(argv)
+    # Outputs keep their input's name, writing them next to the inputs would overwrite the csv files
+    if os.path.realpath(args.output_dir) == os.path.realpath(args.input_dir):
+        parser.error('output_dir must be a different directory than input_dir')
+
+    try:
+        if args.preset:
+            args.preset = load_preset(args.preset)
+        else:
+            gains = args.gains if args.gains is not None else [1.0] * len(MODE_LABELS[args.mode])
+            args.preset = EqualizerPreset(args.mode, args.window, gains, args.band_table)
+    except (OSError, ValueError, KeyError) as error:
+        parser.error(f'invalid preset: {error}')
+    return args
+
+
+def main(argv=None):
+    args = parse_args(argv)
+    os.makedirs(args.output_dir, exist_ok=True)
+    files = find_signal_files(args.input_dir)
+    collisions = find_output_collisions(files, args.output_dir)
+    for output_path, inputs in collisions.items():
+        print(f'{", ".join(inputs)} would all be written to {output_path}', file=sys.stderr)
+    if collisions:
+        return 1
+
+    failed = 0
+    frames = 0
+    start = time.perf_counter()
+    with ProcessPoolExecutor(max_workers=args.workers, initializer=init_worker, initargs=(args.fft_backend, args.precision)) as executor:
+        futures = {
+            executor.submit(equalize_file, file_path, get_output_path(file_path, args.output_dir), args.preset, args.fast_length, args.long_file, args.block_size): file_path
+            for file_path in files
+        }
+        for future in as_completed(futures):
+            try:
+                report = future.result()
+                frames += report.frames
+                print(report)
+            except Exception as error:
+                failed += 1
+                print(f'{futures[future]} failed: {error}', file=sys.stderr)
+
+    seconds = time.perf_counter() - start
+    print(f'Equalized {len(files) - failed}/{len(files)} files in {seconds:.2f} s '
+          f'({(len(files) - failed) / seconds:.1f} files/s, {frames / seconds / 1e6:.2f} Mframes/s)')
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,60 @@
+import os
+import sys
+import tempfile
+from functools import lru_cache
+
+import numpy as np
+import pytest
+
+# Headless Qt, and a throwaway cache so benchmarks never read or fill the user's cache
+os.environ.setdefault('QT_QPA_PLATFORM', 'offscreen')
+os.environ.setdefault('SIGNAL_EQUALIZER_CACHE_DIR', tempfile.mkdtemp(prefix='signal_equalizer_benchmarks_'))
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from managers.equalizer import Equalizer  # noqa: E402
+from models.equalizer_mode import ModeType, WindowType, get_mode_bands  # noqa: E402
+from models.signal import AudioInfo, Signal  # noqa: E402
+
+# Durations in seconds and sample rates in Hz of the synthetic signals, --full-grid runs every pair
+QUICK_DURATIONS = (10, 60)
+QUICK_SAMPLE_RATES = (8000, 48000)
+FULL_DURATIONS = (10, 60, 600, 3600)
+FULL_SAMPLE_RATES = (8000, 22050, 44100, 48000)
+# One gain per music band, shared so every equalizer path is checked against the same curve
+MUSIC_GAINS = [0.5, 1.5, 0.0, 2.0]
+
+
+def pytest_addoption(parser):
+    parser.addoption('--full-grid', action='store_true', help='benchmark signals from 10 s to 1 h at 8 to 48 kHz')
+
+
+def pytest_generate_tests(metafunc):
+    if 'signal_size' in metafunc.fixturenames:
+        full = metafunc.config.getoption('full_grid', default=False)
+        durations = FULL_DURATIONS if full else QUICK_DURATIONS
+        sample_rates = FULL_SAMPLE_RATES if full else QUICK_SAMPLE_RATES
+        sizes = [(duration, sample_rate) for duration in durations for sample_rate in sample_rates]
+        metafunc.parametrize('signal_size', sizes, ids=[f'{duration}s-{sample_rate}Hz' for duration, sample_rate in sizes])
+
+
+@lru_cache(maxsize=4)
+def make_samples(duration: int, sample_rate: int) -> np.ndarray:
+    # Two tones over white noise as 16-bit PCM, seeded so every run benchmarks the same data
+    rng = np.random.default_rng(duration * sample_rate)
+    t = np.arange(duration * sample_rate) / sample_rate
+    y_vec = 0.3 * np.sin(2 * np.pi * 440 * t) + 0.2 * np.sin(2 * np.pi * 1000 * t) + 0.1 * rng.standard_normal(len(t))
+    return np.int16(np.clip(y_vec, -1, 1) * 32767)
+
+
+@pytest.fixture
+def audio_signal(signal_size) -> Signal:
+    duration, sample_rate = signal_size
+    return Signal(None, make_samples(duration, sample_rate), AudioInfo(sample_rate, 2, 1), sample_rate=sample_rate)
+
+
+def get_music_bands(signal: Signal):
+    return get_mode_bands(ModeType.MUSIC, signal.get_sampling_frequency() / 2)
+
+
+def make_equalizer(signal: Signal, window_type: WindowType = WindowType.RECTANGLE, **kwargs) -> Equalizer:
+    return Equalizer(signal, get_music_bands(signal), ModeType.MUSIC, window_type, **kwargs)
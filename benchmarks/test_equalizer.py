@@ -0,0 +1,101 @@
+import numpy as np
+import pytest
+
+from conftest import MUSIC_GAINS, make_equalizer
+from managers.equalizer import EXACT_RECOMPUTE_INTERVAL, PRECISIONS, SINGLE_PRECISION_TOLERANCE, apply_fourier_transform
+from managers.preview_equalizer import get_preview_equalizer
+from models.equalizer_mode import WindowType
+
+# Relative RMS round-off that incremental synthesis may accumulate between two exact recomputes
+INCREMENTAL_TOLERANCE = 1e-9
+
+
+@pytest.mark.benchmark(group='transform')
+def test_apply_fourier_transform(benchmark, audio_signal):
+    benchmark(apply_fourier_transform, audio_signal)
+
+
+@pytest.mark.benchmark(group='transform')
+def test_equalizer_setup(benchmark, audio_signal):
+    benchmark(make_equalizer, audio_signal, pad_to_fast_length=True)
+
+
+@pytest.mark.benchmark(group='band gains')
+@pytest.mark.parametrize('window_type', list(WindowType), ids=lambda window_type: window_type.value)
+def test_perform_window(benchmark, audio_signal, window_type):
+    equalizer = make_equalizer(audio_signal, window_type)
+    benchmark(equalizer.perform_window, MUSIC_GAINS)
+
+
+@pytest.mark.benchmark(group='band gains')
+def test_set_gain(benchmark, audio_signal):
+    equalizer = make_equalizer(audio_signal)
+    gains = iter([0.5, 1.5] * 1000000)
+    benchmark(lambda: equalizer.set_gain(1, next(gains)))
+
+
+@pytest.mark.benchmark(group='synthesis')
+def test_inverse_synthesis(benchmark, audio_signal):
+    equalizer = make_equalizer(audio_signal, pad_to_fast_length=True)
+    equalizer.perform_window(MUSIC_GAINS)
+    benchmark(equalizer.generate_output_signal)
+
+
+@pytest.mark.benchmark(group='synthesis')
+def test_incremental_synthesis(benchmark, audio_signal):
+    # One slider step with the cached band components, which is what a slider drag costs in the GUI
+    equalizer = make_equalizer(audio_signal, incremental=True, pad_to_fast_length=True)
+    gains = iter([0.5, 1.5] * 1000000)
+    benchmark(lambda: (equalizer.set_gain(1, next(gains)), equalizer.generate_output_signal()))
+
+
+@pytest.mark.benchmark(group='synthesis')
+def test_preview_synthesis(benchmark, audio_signal):
+    # The same slider step on the decimated preview, which is what the GUI shows first on long signals
+    preview = get_preview_equalizer(make_equalizer(audio_signal, pad_to_fast_length=True))
+    if preview is None:
+        pytest.skip('signal is short enough to equalize at full rate')
+    gains = iter([0.5, 1.5] * 1000000)
+    benchmark(lambda: (preview.set_gain(1, next(gains)), preview.generate_output_signal()))
+
+
+@pytest.mark.benchmark(group='synthesis')
+def test_evaluate_presets(benchmark, audio_signal):
+    # Sixteen presets in one batched pass, against sixteen rounds of test_inverse_synthesis
+    equalizer = make_equalizer(audio_signal, pad_to_fast_length=True)
+    gain_matrix = np.random.default_rng(0).uniform(0, 2, (16, len(MUSIC_GAINS)))
+    benchmark(equalizer.evaluate_presets, gain_matrix)
+
+
+@pytest.mark.benchmark(group='precision')
+@pytest.mark.parametrize('precision', list(PRECISIONS))
+def test_precision_synthesis(benchmark, audio_signal, precision):
+    equalizer = make_equalizer(audio_signal, pad_to_fast_length=True, dtype=PRECISIONS[precision])
+    equalizer.perform_window(MUSIC_GAINS)
+    benchmark(equalizer.generate_output_signal)
+
+
+@pytest.mark.parametrize('window_type', list(WindowType), ids=lambda window_type: window_type.value)
+def test_single_precision_tolerance(audio_signal, window_type):
+    outputs = [
+        make_equalizer(audio_signal, window_type, pad_to_fast_length=True, dtype=dtype).equalize(MUSIC_GAINS).y_vec
+        for dtype in (np.float32, np.float64)
+    ]
+    error = np.sqrt(np.mean(np.square(outputs[0] - outputs[1])) / np.mean(np.square(outputs[1])))
+    assert outputs[0].dtype == np.float32
+    assert error < SINGLE_PRECISION_TOLERANCE
+
+
+def test_incremental_matches_perform_window(audio_signal):
+    # More slider steps than EXACT_RECOMPUTE_INTERVAL, so outputs both before and after an exact recompute are compared
+    incremental = make_equalizer(audio_signal, WindowType.HANNING, incremental=True)
+    exact = make_equalizer(audio_signal, WindowType.HANNING)
+    rng = np.random.default_rng(0)
+    for step in range(1, EXACT_RECOMPUTE_INTERVAL + 9):
+        incremental.set_gain(step % len(MUSIC_GAINS), rng.uniform(0, 2))
+        if step % 8 == 0:
+            expected = exact.equalize(incremental.gains).y_vec
+            output = incremental.generate_output_signal().y_vec
+            error = np.sqrt(np.mean(np.square(output - expected)) / np.mean(np.square(expected)))
+            assert error < INCREMENTAL_TOLERANCE, f'step {step}'
+    assert incremental.updates_since_exact < EXACT_RECOMPUTE_INTERVAL
@@ -0,0 +1,99 @@
+import os
+import shutil
+
+import numpy as np
+import pytest
+from scipy.io import wavfile
+
+from conftest import make_samples
+from managers.signal_loader import CSVSignalLoader, ExcelXSignalLoader, Mp3SignalLoader, PydubWavSignalLoader, TextSignalLoader, WavSignalLoader
+
+# Text and spreadsheet files of long signals take longer to write than to benchmark, bigger ones are skipped
+MAX_DELIMITED_FRAMES = 10 * 1000 * 1000
+MAX_EXCEL_FRAMES = 100 * 1000
+
+
+@pytest.fixture(scope='session')
+def signal_files(tmp_path_factory):
+    # Files of every signal size, written on first use and shared by the whole session
+    files_dir = tmp_path_factory.mktemp('signals')
+
+    def get_file(signal_size, extension: str) -> str:
+        duration, sample_rate = signal_size
+        file_path = os.path.join(files_dir, f'{duration}s-{sample_rate}Hz.{extension}')
+        if not os.path.exists(file_path):
+            y_vec = make_samples(duration, sample_rate)
+            if extension == 'wav':
+                wavfile.write(file_path, sample_rate, y_vec)
+            elif extension == 'mp3':
+                from pydub import AudioSegment
+                AudioSegment(y_vec.tobytes(), frame_rate=sample_rate, sample_width=2, channels=1).export(file_path, format='mp3')
+            else:
+                x_vec = np.arange(len(y_vec)) / sample_rate
+                if extension == 'xlsx':
+                    import pandas as pd
+                    pd.DataFrame({'time': x_vec, 'amplitude': y_vec}).to_excel(file_path, index=False)
+                else:
+                    np.savetxt(file_path, np.column_stack((x_vec, y_vec)), delimiter=',', header='time,amplitude', comments='')
+        return file_path
+
+    return get_file
+
+
+def load_and_read(loader, file_path: str):
+    # Memory-mapped loaders defer reading to the first access, so every benchmark touches all samples
+    signal = loader.load(file_path)
+    np.asarray(signal.y_vec).max()
+    return signal
+
+
+def skip_larger_than(signal_size, max_frames: int):
+    duration, sample_rate = signal_size
+    if duration * sample_rate > max_frames:
+        pytest.skip(f'more than {max_frames} frames')
+
+
+@pytest.mark.benchmark(group='load wav')
+def test_wav_loader(benchmark, signal_files, signal_size):
+    benchmark(load_and_read, WavSignalLoader(), signal_files(signal_size, 'wav'))
+
+
+@pytest.mark.benchmark(group='load wav')
+def test_pydub_wav_loader(benchmark, signal_files, signal_size):
+    benchmark(load_and_read, PydubWavSignalLoader(), signal_files(signal_size, 'wav'))
+
+
+@pytest.mark.benchmark(group='load mp3')
+def test_mp3_loader(benchmark, signal_files, signal_size):
+    if shutil.which('ffmpeg') is None:
+        pytest.skip('ffmpeg is not installed')
+    skip_larger_than(signal_size, MAX_DELIMITED_FRAMES)
+    benchmark(load_and_read, Mp3SignalLoader(), signal_files(signal_size, 'mp3'))
+
+
+@pytest.mark.benchmark(group='load csv')
+def test_csv_loader(benchmark, signal_files, signal_size):
+    skip_larger_than(signal_size, MAX_DELIMITED_FRAMES)
+    benchmark(load_and_read, CSVSignalLoader(use_cache=False), signal_files(signal_size, 'csv'))
+
+
+@pytest.mark.benchmark(group='load csv')
+def test_cached_csv_loader(benchmark, signal_files, signal_size):
+    skip_larger_than(signal_size, MAX_DELIMITED_FRAMES)
+    file_path = signal_files(signal_size, 'csv')
+    # The first load fills the cache, the benchmark measures the hits
+    CSVSignalLoader().load(file_path)
+    benchmark(load_and_read, CSVSignalLoader(), file_path)
+
+
+@pytest.mark.benchmark(group='load txt')
+def test_text_loader(benchmark, signal_files, signal_size):
+    skip_larger_than(signal_size, MAX_DELIMITED_FRAMES)
+    benchmark(load_and_read, TextSignalLoader(use_cache=False), signal_files(signal_size, 'txt'))
+
+
+@pytest.mark.benchmark(group='load xlsx')
+def test_excelx_loader(benchmark, signal_files, signal_size):
+    pytest.importorskip('openpyxl')
+    skip_larger_than(signal_size, MAX_EXCEL_FRAMES)
+    benchmark(load_and_read, ExcelXSignalLoader(), signal_files(signal_size, 'xlsx'))
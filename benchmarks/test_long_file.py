@@ -0,0 +1,42 @@
+import wave
+
+import numpy as np
+import pytest
+
+from conftest import MUSIC_GAINS, get_music_bands, make_equalizer, make_samples
+from managers.long_file_equalizer import LONG_FILE_TOLERANCE, LongFileEqualizer
+from models.equalizer_mode import WindowType
+from models.signal import AudioInfo, Signal
+
+
+def equalize_blocks(signal, window_type: WindowType) -> np.ndarray:
+    long_file_equalizer = LongFileEqualizer(signal, get_music_bands(signal), window_type)
+    long_file_equalizer.set_gains(MUSIC_GAINS)
+    return np.concatenate([block for _, block in long_file_equalizer.iter_blocks()])
+
+
+@pytest.mark.benchmark(group='long file')
+def test_iter_blocks(benchmark, audio_signal):
+    benchmark(equalize_blocks, audio_signal, WindowType.HANNING)
+
+
+@pytest.mark.parametrize('window_type', list(WindowType), ids=lambda window_type: window_type.value)
+def test_long_file_tolerance(audio_signal, window_type):
+    expected = make_equalizer(audio_signal, window_type).equalize(MUSIC_GAINS).y_vec
+    output = equalize_blocks(audio_signal, window_type)
+    assert output.shape == expected.shape
+    error = np.sqrt(np.mean(np.square(output - expected)) / np.mean(np.square(expected)))
+    assert error < LONG_FILE_TOLERANCE
+
+
+def test_equalize_to_file_keeps_sample_width(tmp_path):
+    # 32-bit input comes back as 32-bit wav, unchanged at unit gains
+    y_vec = make_samples(10, 8000).astype(np.int32) << 16
+    signal = Signal(None, y_vec, AudioInfo(8000, 4, 1), sample_rate=8000)
+    bands = get_music_bands(signal)
+    output_path = str(tmp_path / 'output.wav')
+    LongFileEqualizer(signal, bands, WindowType.RECTANGLE).equalize_to_file(output_path, [1.0] * len(bands))
+    with wave.open(output_path, 'rb') as wav_file:
+        assert wav_file.getsampwidth() == 4
+        output = np.frombuffer(wav_file.readframes(wav_file.getnframes()), dtype=np.int32)
+    assert np.array_equal(output, y_vec)
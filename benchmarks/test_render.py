@@ -0,0 +1,48 @@
+import numpy as np
+import pytest
+
+from managers.min_max_pyramid import MinMaxPyramid
+from managers.spectrogram import Spectrogram
+
+PLOT_WIDTH = 1000
+
+
+@pytest.fixture(scope='module')
+def qt_app():
+    from PyQt6.QtWidgets import QApplication
+    return QApplication.instance() or QApplication([])
+
+
+@pytest.mark.benchmark(group='spectrogram')
+def test_spectrogram(benchmark, audio_signal):
+    benchmark(Spectrogram, audio_signal)
+
+
+@pytest.mark.benchmark(group='spectrogram')
+def test_output_spectrogram_image(benchmark, audio_signal):
+    spectrogram = Spectrogram(audio_signal)
+    gain_curve = np.linspace(0, 2, len(spectrogram.frequencies))
+    benchmark(spectrogram.get_image, gain_curve)
+
+
+@pytest.mark.benchmark(group='waveform')
+def test_min_max_pyramid(benchmark, audio_signal):
+    benchmark(MinMaxPyramid, audio_signal)
+
+
+@pytest.mark.benchmark(group='waveform')
+def test_pyramid_query(benchmark, audio_signal):
+    pyramid = MinMaxPyramid(audio_signal)
+    benchmark(pyramid.query, audio_signal.start_time, audio_signal.end_time, PLOT_WIDTH)
+
+
+@pytest.mark.benchmark(group='waveform')
+def test_decimated_plot_refresh(benchmark, qt_app, audio_signal):
+    import pyqtgraph as pg
+    from decimated_plot import DecimatedPlot
+
+    plot_widget = pg.PlotWidget()
+    plot_widget.resize(PLOT_WIDTH, 300)
+    plot = DecimatedPlot(plot_widget)
+    plot.set_pyramid(MinMaxPyramid(audio_signal))
+    benchmark(plot.refresh)
@@ -0,0 +1,34 @@
+import os
+import re
+import subprocess
+import sys
+
+import pytest
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+# Cumulative import time of main.py in ms. It's about 0.5 s on a dev laptop, mostly PyQt6, pyqtgraph and numpy.
+STARTUP_IMPORT_BUDGET = 1500
+# Imported on first use only: the gaussian window, the csv/mp3/wav loaders, playback and FLAC export
+LAZY_MODULES = ('scipy.signal', 'pandas', 'pydub', 'sounddevice', 'soundfile', 'matplotlib')
+
+
+def import_main() -> dict:
+    # Imports main.py in a fresh interpreter, returns the cumulative import time in µs of every module
+    environment = dict(os.environ, QT_QPA_PLATFORM='offscreen')
+    result = subprocess.run([sys.executable, '-X', 'importtime', '-c', 'import main'], cwd=ROOT, env=environment, capture_output=True, text=True, check=True)
+    times = {}
+    for match in re.finditer(r'^import time:\s+\d+ \|\s+(\d+) \| +(\S+)$', result.stderr, re.MULTILINE):
+        times.setdefault(match.group(2), int(match.group(1)))
+    return times
+
+
+def test_startup_imports():
+    times = import_main()
+    assert times['main'] / 1000 < STARTUP_IMPORT_BUDGET, f"import main took {times['main'] / 1000:.0f} ms"
+    for module in LAZY_MODULES:
+        assert module not in times, f'{module} is imported at startup'
+
+
+@pytest.mark.benchmark(group='startup')
+def test_startup(benchmark):
+    benchmark.pedantic(import_main, rounds=5)
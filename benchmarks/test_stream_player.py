@@ -0,0 +1,106 @@
+import itertools
+import time
+import wave
+from functools import partial
+
+import numpy as np
+
+from conftest import MUSIC_GAINS, get_music_bands, make_equalizer, make_samples
+from managers.block_equalizer import STREAM_BLOCK_SIZE, BlockEqualizer, get_window_std
+from managers.stream_player import NullOutputStream, StreamPlayer
+from models.equalizer_mode import WindowType
+from models.signal import AudioInfo, Signal
+
+SAMPLE_RATE = 8000
+TONE_BAND = [300, 600]
+# Block at which the tone's band is muted mid-stream
+MUTE_BLOCK = 6
+# Relative RMS difference between the streamed output and the whole-signal Equalizer's, with gaussian bands
+STREAM_TOLERANCE = 0.05
+
+
+def make_tone_signal() -> Signal:
+    # Two seconds of a half-scale 440 Hz tone as 16-bit PCM
+    t = np.arange(2 * SAMPLE_RATE) / SAMPLE_RATE
+    return Signal(None, np.int16(np.round(16384 * np.sin(2 * np.pi * 440 * t))), AudioInfo(SAMPLE_RATE, 2, 1), sample_rate=SAMPLE_RATE)
+
+
+def play(player: StreamPlayer, file_path) -> np.ndarray:
+    # Plays the whole signal through the file-backed null stream, returns what was written in [-1, 1]
+    player.start()
+    deadline = time.monotonic() + 10
+    while player.is_active and time.monotonic() < deadline:
+        time.sleep(0.01)
+    with wave.open(str(file_path), 'rb') as wav_file:
+        return np.frombuffer(wav_file.readframes(wav_file.getnframes()), dtype=np.int16) / 32767
+
+
+def test_unit_gain_reconstruction(tmp_path):
+    signal = make_tone_signal()
+    file_path = tmp_path / 'unit_gain.wav'
+    block_equalizer = BlockEqualizer([TONE_BAND], SAMPLE_RATE)
+    output = play(StreamPlayer(signal, block_equalizer, stream_factory=partial(NullOutputStream, file_path=str(file_path))), file_path)
+    # The equalizer delays its output by one block, the rest is the input up to 16-bit rounding
+    played = output[STREAM_BLOCK_SIZE:STREAM_BLOCK_SIZE + signal.sample_count]
+    assert len(played) == signal.sample_count
+    np.testing.assert_allclose(played, signal.y_vec / signal.full_scale, atol=2 / 32767)
+
+
+def test_gain_change_within_one_block(tmp_path):
+    signal = make_tone_signal()
+    file_path = tmp_path / 'muted.wav'
+    block_equalizer = BlockEqualizer([TONE_BAND], SAMPLE_RATE)
+    blocks = itertools.count()
+
+    def muting_stream(callback, **kwargs):
+        # Mutes the tone's band right before the MUTE_BLOCK-th callback, like a slider moved mid-stream
+        def mute_callback(*args):
+            if next(blocks) == MUTE_BLOCK:
+                block_equalizer.gains[0] = 0
+            callback(*args)
+        return NullOutputStream(callback=mute_callback, file_path=str(file_path), **kwargs)
+
+    output = play(StreamPlayer(signal, block_equalizer, stream_factory=muting_stream), file_path)
+    output_blocks = output[:len(output) // STREAM_BLOCK_SIZE * STREAM_BLOCK_SIZE].reshape(-1, STREAM_BLOCK_SIZE)
+    rms = np.sqrt(np.mean(np.square(output_blocks), axis=1))
+    # The block before the change still plays the tone, the one after the changed block is silent
+    assert rms[MUTE_BLOCK - 1] > 0.3
+    assert rms[MUTE_BLOCK + 1] < 0.01 * rms[MUTE_BLOCK - 1]
+
+
+def test_gaussian_matches_equalizer(tmp_path):
+    # The gaussian's width in Hz depends on the transform length, so the stream is given the whole signal's
+    signal = Signal(None, make_samples(20, SAMPLE_RATE), AudioInfo(SAMPLE_RATE, 2, 1), sample_rate=SAMPLE_RATE)
+    bands = get_music_bands(signal)
+    expected = make_equalizer(signal, WindowType.GAUSSIAN).equalize(MUSIC_GAINS).y_vec / signal.full_scale
+    file_path = tmp_path / 'gaussian.wav'
+    window_std = get_window_std(signal.sample_count, SAMPLE_RATE, 2 * STREAM_BLOCK_SIZE)
+    block_equalizer = BlockEqualizer(bands, SAMPLE_RATE, WindowType.GAUSSIAN, window_std=window_std)
+    block_equalizer.gains[:] = MUSIC_GAINS
+    output = play(StreamPlayer(signal, block_equalizer, stream_factory=partial(NullOutputStream, file_path=str(file_path))), file_path)
+    played = output[STREAM_BLOCK_SIZE:STREAM_BLOCK_SIZE + signal.sample_count]
+    error = np.sqrt(np.mean(np.square(played - expected)) / np.mean(np.square(expected)))
+    assert error < STREAM_TOLERANCE
+
+
+def test_seek_keeps_the_stream(tmp_path):
+    signal = make_tone_signal()
+    file_path = tmp_path / 'seek.wav'
+    streams = []
+
+    def seeking_stream(callback, **kwargs):
+        # Seeks to one second right before the second callback, like a drag of the time slider
+        def seek_callback(*args):
+            if len(streams) == 1 and streams[0].frames_played == STREAM_BLOCK_SIZE:
+                player.seek(1.0)
+            callback(*args)
+        streams.append(NullOutputStream(callback=seek_callback, file_path=str(file_path), **kwargs))
+        return streams[-1]
+
+    player = StreamPlayer(signal, stream_factory=seeking_stream)
+    output = play(player, file_path)
+    assert len(streams) == 1
+    # The first block plays from the start, the rest from one second on
+    seek_position = signal.index_at(1.0)
+    expected = np.concatenate((signal.y_vec[:STREAM_BLOCK_SIZE], signal.y_vec[seek_position:])) / signal.full_scale
+    np.testing.assert_allclose(output[:len(expected)], expected, atol=2 / 32767)
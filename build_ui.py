@@ -0,0 +1,26 @@
+import os
+import sys
+
+from PyQt6 import uic
+
+ROOT = os.path.dirname(os.path.abspath(__file__))
+# Relative to ROOT, the generated modules record the .ui path they were compiled from
+VIEWS_DIR = 'views'
+
+
+def build_ui(views_dir: str = VIEWS_DIR):
+    # Compiles every views/<name>.ui to views/<name>_ui.py, so the app doesn't parse XML at startup.
+    # Run it after editing a .ui file; a .ui newer than its module is loaded at runtime instead.
+    # Paths are kept relative to the repository root so rebuilds are the same on every machine.
+    os.chdir(ROOT)
+    for file in sorted(os.listdir(views_dir)):
+        if file.endswith('.ui'):
+            ui_path = os.path.join(views_dir, file)
+            module_path = os.path.join(views_dir, file[:-3] + '_ui.py')
+            with open(module_path, 'w') as module_file:
+                uic.compileUi(ui_path, module_file)
+            print(f'{ui_path} -> {module_path}')
+
+
+if __name__ == "__main__":
+    sys.exit(build_ui())
@@ -0,0 +1,34 @@
+import pyqtgraph as pg
+
+from managers.min_max_pyramid import MinMaxPyramid
+
+
+class DecimatedPlot:
+    # Keeps one curve of a PlotWidget in sync with a MinMaxPyramid, re-querying it on every x-range or size change
+    def __init__(self, plot_widget: pg.PlotWidget, pen=None) -> None:
+        self.plot_widget = plot_widget
+        self.pyramid: MinMaxPyramid = None
+        self.item = pg.PlotDataItem(pen=pen if pen is not None else pg.mkPen(color=(255, 255, 255)))
+        self.plot_widget.getViewBox().sigXRangeChanged.connect(self.refresh)
+        self.plot_widget.getViewBox().sigResized.connect(self.refresh)
+
+    def set_pyramid(self, pyramid: MinMaxPyramid):
+        self.pyramid = pyramid
+        # The widget may have been cleared since the curve was last shown
+        if self.item.getViewBox() is None:
+            self.plot_widget.addItem(self.item)
+        signal = pyramid.signal
+        self.plot_widget.setXRange(signal.start_time, signal.end_time)
+        self.plot_widget.setYRange(*pyramid.y_range)
+        self.refresh()
+
+    def clear(self):
+        self.pyramid = None
+        self.item.setData([], [])
+
+    def refresh(self, *args):
+        if self.pyramid is None:
+            return
+        view_box = self.plot_widget.getViewBox()
+        start_time, end_time = view_box.viewRange()[0]
+        self.item.setData(*self.pyramid.query(start_time, end_time, int(view_box.width()) or 1000))
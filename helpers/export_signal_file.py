@@ -0,0 +1,19 @@
+import os
+from managers.signal_exporter import ISignalExporter, WavSignalExporter, FlacSignalExporter, CSVSignalExporter
+from models.signal import Signal
+
+SIGNAL_EXPORTERS = {
+    'wav': WavSignalExporter,
+    'flac': FlacSignalExporter,
+    'csv': CSVSignalExporter,
+    'txt': CSVSignalExporter,
+}
+
+
+def export_signal_file(signal: Signal, file_path: str, chunks=None):
+    # Picking the exporter from the extension of file_path
+    file_type = os.path.splitext(file_path)[1][1:].lower()
+    if file_type not in SIGNAL_EXPORTERS:
+        raise ValueError(f"Can't export to '.{file_type}' files, expected one of {list(SIGNAL_EXPORTERS)}")
+    exporter: ISignalExporter = SIGNAL_EXPORTERS[file_type]()
+    exporter.export(signal, file_path, chunks)
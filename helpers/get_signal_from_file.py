@@ -1,33 +1,7 @@
-
 from PyQt6 import QtCore, QtWidgets
-from managers.signal_loader import ISignalLoader, TextSignalLoader, CSVSignalLoader, ExcelXSignalLoader, ExcelSignalLoader, Mp3SignalLoader, WavSignalLoader
-from models.signal import Signal
 
 
-def get_signal_from_file(app):
+def get_signal_file_path(app):
         # get path of signal files only of types (xls, csv, txt)
         file_path, _ = QtWidgets.QFileDialog.getOpenFileName(app, 'Single File', QtCore.QDir.rootPath(), "(*.mp3);;(*.txt);;(*.xls);;(*.xlsx);;(*.csv);;(*.wav)")
-        if not file_path:
-            return None
-        # check the type of signal file
-        file_type = file_path.split('.')[-1]
-        file_name = file_path.split('.')[0].split('/')[-1]
-
-        # Picking the right loader from file_type
-        loader: ISignalLoader
-        if file_type == 'xls':
-            loader = ExcelSignalLoader()
-        elif file_type == 'xlsx':
-            loader = ExcelXSignalLoader()
-        elif file_type == 'csv':
-            loader = CSVSignalLoader()
-        elif file_type == 'txt':
-            loader = TextSignalLoader()
-        elif file_type == 'mp3':
-            loader = Mp3SignalLoader()
-        else:
-            loader = WavSignalLoader()
-            
-        
-        signal: Signal = loader.load(file_path)
-        return signal, file_name
\ No newline at end of file
+        return file_path or None
@@ -0,0 +1,45 @@
+import os
+from helpers.spectrum_cache import get_spectrum_cache
+from managers.signal_loader import ISignalLoader, TextSignalLoader, CSVSignalLoader, ExcelXSignalLoader, ExcelSignalLoader, Mp3SignalLoader, WavSignalLoader
+from models.signal import Signal
+
+SIGNAL_LOADERS = {
+    'xls': ExcelSignalLoader,
+    'xlsx': ExcelXSignalLoader,
+    'csv': CSVSignalLoader,
+    'txt': TextSignalLoader,
+    'mp3': Mp3SignalLoader,
+    'wav': WavSignalLoader,
+}
+
+
+def load_signal_file(file_path: str, hash_content: bool = True):
+    # check the type of signal file
+    file_name, file_type = os.path.splitext(os.path.basename(file_path))
+    file_type = file_type[1:].lower()
+
+    # A file that was loaded before in this session is taken from the cache, with a fresh playback state
+    cache = get_spectrum_cache()
+    content_key = cache.find_content_key(file_path) if cache.enabled else None
+    cached_signal: Signal = cache.get_signal(content_key) if content_key else None
+    if cached_signal is not None:
+        signal = cached_signal.derive(cached_signal.y_vec, cached_signal.audio)
+        signal.content_key = content_key
+        return signal, file_name
+
+    # Picking the right loader from file_type, wav being the fallback
+    loader: ISignalLoader = SIGNAL_LOADERS.get(file_type, WavSignalLoader)()
+    signal: Signal = loader.load(file_path)
+    # Without hash_content the caller hashes the file with hash_signal_file once the signal is shown
+    if hash_content:
+        hash_signal_file(signal, file_path)
+    return signal, file_name
+
+
+def hash_signal_file(signal: Signal, file_path: str):
+    # Keys the signal by its file's content, so its spectrum and later imports of the file hit the cache
+    cache = get_spectrum_cache()
+    if signal.content_key is not None or not cache.enabled:
+        return
+    signal.content_key = cache.get_content_key(file_path)
+    cache.put_signal(signal.content_key, signal)
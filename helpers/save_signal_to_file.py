@@ -0,0 +1,15 @@
+import os
+from PyQt6 import QtCore, QtWidgets
+from helpers.export_signal_file import export_signal_file
+
+
+def save_signal_to_file(app, signal):
+        # ask for the path of the exported file, its extension picks the format
+        file_path, selected_filter = QtWidgets.QFileDialog.getSaveFileName(app, 'Export File', QtCore.QDir.homePath(), "(*.wav);;(*.flac);;(*.csv)")
+        if not file_path:
+            return None
+        if not os.path.splitext(file_path)[1]:
+            # "(*.wav)" -> ".wav"
+            file_path += selected_filter[2:-1]
+        export_signal_file(signal, file_path)
+        return file_path
@@ -0,0 +1,50 @@
+import hashlib
+import json
+import os
+
+import numpy as np
+
+from models.signal import Signal
+
+# Decoded table signals are kept here as .npy files, set SIGNAL_EQUALIZER_CACHE_DIR to move it
+CACHE_DIR = os.environ.get('SIGNAL_EQUALIZER_CACHE_DIR', os.path.join(os.path.expanduser('~'), '.cache', 'signal_equalizer_studio'))
+
+
+def get_cache_key(file_path: str) -> str:
+    # A file edited or replaced in place gets a new size or mtime, and so a new key
+    stat = os.stat(file_path)
+    key = f'{os.path.abspath(file_path)}|{stat.st_size}|{stat.st_mtime_ns}'
+    return hashlib.sha1(key.encode()).hexdigest()
+
+
+def load_cached_signal(file_path: str, cache_dir: str = CACHE_DIR):
+    entry_path = os.path.join(cache_dir, 'signals', get_cache_key(file_path))
+    try:
+        with open(entry_path + '.json') as metadata_file:
+            metadata = json.load(metadata_file)
+        y_vec = np.load(entry_path + '.y.npy', mmap_mode='r')
+        if metadata['sample_rate'] is not None:
+            return Signal(None, y_vec, sample_rate=metadata['sample_rate'], start_time=metadata['start_time'])
+        return Signal(np.load(entry_path + '.x.npy', mmap_mode='r'), y_vec)
+    except (OSError, ValueError, KeyError):
+        return None
+
+
+def save_cached_signal(file_path: str, signal: Signal, cache_dir: str = CACHE_DIR):
+    signals_dir = os.path.join(cache_dir, 'signals')
+    entry_path = os.path.join(signals_dir, get_cache_key(file_path))
+    try:
+        os.makedirs(signals_dir, exist_ok=True)
+        np.save(entry_path + '.y.npy', signal.y_vec)
+        if not signal.is_uniform:
+            np.save(entry_path + '.x.npy', signal.x_vec)
+        metadata = {
+            'sample_rate': signal.sample_rate if signal.is_uniform else None,
+            'start_time': signal.start_time if signal.is_uniform else None,
+        }
+        # Metadata is written last, an entry without it is never read back
+        with open(entry_path + '.json', 'w') as metadata_file:
+            json.dump(metadata, metadata_file)
+    except OSError:
+        # The cache is only an optimization, a read-only or full disk must not break loading
+        pass
@@ -0,0 +1,149 @@
+import hashlib
+import os
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+
+from helpers.signal_cache import CACHE_DIR, get_cache_key
+
+# Loaded signals and spectra are kept in memory up to this many bytes, least recently used first out
+SPECTRUM_CACHE_MEMORY_BUDGET = int(os.environ.get('SIGNAL_EQUALIZER_SPECTRUM_MEMORY_BUDGET', 1024 ** 3))
+# Spectra are also written to CACHE_DIR/spectra, which is trimmed back to this many bytes
+SPECTRUM_CACHE_DISK_BUDGET = int(os.environ.get('SIGNAL_EQUALIZER_SPECTRUM_DISK_BUDGET', 4 * 1024 ** 3))
+# A spectrum bigger than this share of the disk budget is only kept in memory, so one long file can't
+# flush every other entry or stall on a multi-gigabyte write
+SPECTRUM_CACHE_DISK_ENTRY_FRACTION = 0.25
+CONTENT_HASH_CHUNK_SIZE = 4 * 1024 ** 2
+
+
+class SpectrumCache:
+    """Two-level LRU cache of loaded signals and their rfft, keyed by the hash of the file's content.
+
+    Signals only live in memory, spectra are also saved as .npy files so they survive a restart. The
+    files are written on a background thread, so caching a spectrum doesn't hold up the caller.
+    A budget of 0 disables the matching level. Cached arrays are shared, so they are read-only.
+    """
+
+    def __init__(self, memory_budget: int = SPECTRUM_CACHE_MEMORY_BUDGET, disk_budget: int = SPECTRUM_CACHE_DISK_BUDGET, cache_dir: str = CACHE_DIR) -> None:
+        self.memory_budget = memory_budget
+        self.disk_budget = disk_budget
+        self.spectra_dir = os.path.join(cache_dir, 'spectra')
+        self.entries = OrderedDict()
+        self.memory_size = 0
+        # Content hashes by path, size and mtime, so an unchanged file is only read once per session
+        self.content_keys = {}
+        # One writer, so saves and disk evictions never race. Its thread is joined at exit, so pending
+        # saves still complete.
+        self._disk_writer = ThreadPoolExecutor(max_workers=1, thread_name_prefix='spectrum-cache')
+        self._pending_saves = []
+
+    @property
+    def enabled(self) -> bool:
+        return self.memory_budget > 0 or self.disk_budget > 0
+
+    def get_content_key(self, file_path: str) -> str:
+        stat_key = get_cache_key(file_path)
+        if stat_key not in self.content_keys:
+            content_hash = hashlib.sha1()
+            with open(file_path, 'rb') as file:
+                for chunk in iter(lambda: file.read(CONTENT_HASH_CHUNK_SIZE), b''):
+                    content_hash.update(chunk)
+            self.content_keys[stat_key] = content_hash.hexdigest()
+        return self.content_keys[stat_key]
+
+    def find_content_key(self, file_path: str):
+        # The hash of a file that was already hashed this session and hasn't changed since, without reading it
+        return self.content_keys.get(get_cache_key(file_path))
+
+    def get_signal(self, content_key: str):
+        return self._get('signal', content_key)
+
+    def put_signal(self, content_key: str, signal):
+        nbytes = signal.y_vec.nbytes + (0 if signal.is_uniform else signal.x_vec.nbytes)
+        self._put(('signal', content_key), signal, nbytes)
+
+    def get_spectrum(self, spectrum_key: str):
+        spectrum = self._get('spectrum', spectrum_key)
+        if spectrum is not None or self.disk_budget <= 0:
+            return spectrum
+        entry_path = os.path.join(self.spectra_dir, spectrum_key + '.npy')
+        try:
+            spectrum = np.asarray(np.load(entry_path, mmap_mode='r'))
+            # Bumps the mtime, which is what disk eviction orders entries by
+            os.utime(entry_path)
+        except (OSError, ValueError):
+            return None
+        self._put(('spectrum', spectrum_key), spectrum, spectrum.nbytes)
+        return spectrum
+
+    def put_spectrum(self, spectrum_key: str, spectrum: np.ndarray):
+        spectrum.flags.writeable = False
+        self._put(('spectrum', spectrum_key), spectrum, spectrum.nbytes)
+        if 0 < spectrum.nbytes <= self.disk_budget * SPECTRUM_CACHE_DISK_ENTRY_FRACTION:
+            self._pending_saves = [save for save in self._pending_saves if not save.done()]
+            self._pending_saves.append(self._disk_writer.submit(self._save_spectrum, spectrum_key, spectrum))
+
+    def flush(self):
+        # Waits for the spectra queued for disk to be written
+        for save in self._pending_saves:
+            save.result()
+        self._pending_saves = []
+
+    def _get(self, kind: str, key: str):
+        entry = self.entries.get((kind, key))
+        if entry is None:
+            return None
+        self.entries.move_to_end((kind, key))
+        return entry[0]
+
+    def _put(self, key: tuple, value, nbytes: int):
+        if nbytes > self.memory_budget:
+            return
+        if key in self.entries:
+            self.memory_size -= self.entries.pop(key)[1]
+        self.entries[key] = (value, nbytes)
+        self.memory_size += nbytes
+        while self.memory_size > self.memory_budget:
+            _, (_, evicted_nbytes) = self.entries.popitem(last=False)
+            self.memory_size -= evicted_nbytes
+
+    def _save_spectrum(self, spectrum_key: str, spectrum: np.ndarray):
+        entry_path = os.path.join(self.spectra_dir, spectrum_key + '.npy')
+        try:
+            os.makedirs(self.spectra_dir, exist_ok=True)
+            # Written under a temporary name first, a partial file is never read back
+            np.save(entry_path + '.tmp.npy', spectrum)
+            os.replace(entry_path + '.tmp.npy', entry_path)
+            self._evict_disk()
+        except OSError:
+            # The cache is only an optimization, a read-only or full disk must not break equalizing
+            pass
+
+    def _evict_disk(self):
+        entries = []
+        for file_name in os.listdir(self.spectra_dir):
+            if file_name.endswith('.npy') and not file_name.endswith('.tmp.npy'):
+                stat = os.stat(os.path.join(self.spectra_dir, file_name))
+                entries.append((stat.st_mtime_ns, stat.st_size, file_name))
+        disk_size = sum(size for _, size, _ in entries)
+        for _, size, file_name in sorted(entries):
+            if disk_size <= self.disk_budget:
+                break
+            os.remove(os.path.join(self.spectra_dir, file_name))
+            disk_size -= size
+
+
+def get_spectrum_key(content_key: str, fft_length: int, sample_rate: float, downmix: bool, dtype=np.float64) -> str:
+    key = f'{content_key}|{fft_length}|{sample_rate}|{downmix}|{np.dtype(dtype).name}'
+    return hashlib.sha1(key.encode()).hexdigest()
+
+
+_spectrum_cache: SpectrumCache = None
+
+
+def get_spectrum_cache() -> SpectrumCache:
+    global _spectrum_cache
+    if _spectrum_cache is None:
+        _spectrum_cache = SpectrumCache()
+    return _spectrum_cache
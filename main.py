@@ -3,34 +3,33 @@ import sys
 from PyQt6.QtGui import *
 from PyQt6.QtWidgets import *
 import pyqtgraph as pg
-import sounddevice as sd
-from threading import Thread
 import numpy as np
 import math
-from PyQt6.QtCore import QTimer
-from scipy.signal import gaussian
-from pydub import AudioSegment
-
-from helpers.get_signal_from_file import get_signal_from_file
+from PyQt6.QtCore import QDir, QTimer
+
+from helpers.get_signal_from_file import get_signal_file_path
+from helpers.save_signal_to_file import save_signal_to_file
+from decimated_plot import DecimatedPlot
+from performance_overlay import PerformanceOverlay
+from managers.spectrogram import Spectrogram
+from managers.equalizer import Equalizer
+from managers.import_worker import IMPORT_STAGES, ImportStage, ImportWorker
+from managers.profiler import PROFILER, profiled
+from managers.recompute_worker import RecomputeWorker, RecomputeResult
+from managers.block_equalizer import STREAM_BLOCK_SIZE, BlockEqualizer, get_window_std
+from managers.stream_player import StreamPlayer
 from models.signal import Signal
-from enum import Enum
+from models.equalizer_mode import ModeType, WindowType, MODE_LABELS
 from functools import partial
 
 mainwindow_ui_file_path = os.path.join(os.path.dirname(__file__), 'views', 'mainwindow.ui')
-uiclass, baseclass = pg.Qt.loadUiType(mainwindow_ui_file_path)
-
-
-class WindowType(Enum):
-    RECTANGLE = 'rectangle'
-    HAMMING = 'hamming'
-    HANNING = 'hanning'
-    GAUSSIAN = 'gaussian'
-
-class ModeType(Enum):
-    ANIMALS = 'animals'
-    MUSIC = 'music'
-    UNIFORM = 'uniform'
-    ECG = 'ecg'
+mainwindow_module_path = os.path.join(os.path.dirname(__file__), 'views', 'mainwindow_ui.py')
+# The module compiled by build_ui.py skips parsing the .ui file, unless the .ui was edited since
+if os.path.exists(mainwindow_module_path) and os.path.getmtime(mainwindow_module_path) >= os.path.getmtime(mainwindow_ui_file_path):
+    from views.mainwindow_ui import Ui_MainWindow
+    uiclass, baseclass = Ui_MainWindow, QMainWindow
+else:
+    uiclass, baseclass = pg.Qt.loadUiType(mainwindow_ui_file_path)
 
 class MainWindow(uiclass, baseclass):
     
@@ -40,22 +39,50 @@ class MainWindow(uiclass, baseclass):
         self.setWindowTitle("Signal Equalizer Studio")
         self.signal = None
         self.output : Signal = None
+        self.equalizer : Equalizer = None
+        self.preview_equalizer : Equalizer = None
+        self.spectrogram : Spectrogram = None
+        self.stream_player : StreamPlayer = None
+        self.input_player : StreamPlayer = None
         self.output_current_timer = QTimer(self)
-        self.phase = None
-        self.frequencies = None
-        self.original_fourier_transform = None
-        self.magnitude_dB = None
-        self.fourier_transform = None
+        self.window_plot_item = None
+        self.window_plot_scale = 1
+        self.spectrogram_levels = None
         self.current_timer = QTimer(self)
         self.window_type = WindowType.RECTANGLE
         self.mode = ModeType.ANIMALS
         self.slider_values = []
         self.lower_upper_freq_list = []
         self.file_name = None
+        self.recompute_worker = RecomputeWorker(self)
+        self.import_worker = ImportWorker(self)
+        self.input_plot = DecimatedPlot(self.input_signal_graph)
+        self.output_plot = DecimatedPlot(self.output_signal_graph)
+        cursor_pen = pg.mkPen(color=(255, 255, 0))
+        self.input_cursor = pg.InfiniteLine(pos=0, angle=90, movable=False, pen=cursor_pen)
+        self.output_cursor = pg.InfiniteLine(pos=0, angle=90, movable=False, pen=cursor_pen)
+        # Slider drags are coalesced for this many milliseconds before a recompute is requested
+        self.recompute_timer = QTimer(self)
+        self.recompute_timer.setSingleShot(True)
+        self.recompute_timer.setInterval(30)
+        self.performance_overlay = PerformanceOverlay(PROFILER, self)
+        self.statusbar.addPermanentWidget(self.performance_overlay)
+        # Shown while an import runs in the background
+        self.import_progress = QProgressBar(self)
+        self.import_progress.setRange(0, len(IMPORT_STAGES))
+        self.import_progress.setMaximumWidth(200)
+        self.import_cancel_button = QPushButton('Cancel', self)
+        self.statusbar.addWidget(self.import_progress)
+        self.statusbar.addWidget(self.import_cancel_button)
+        self.import_progress.hide()
+        self.import_cancel_button.hide()
         self._initialize_signals_slots()
+        self.recompute_worker.start()
+        self.import_worker.start()
 
     def _initialize_signals_slots(self):
         self.import_action.triggered.connect(self._import_signal_file)
+        self.export_action.triggered.connect(self._export_output_signal)
         self.input_play_button.pressed.connect(self.play_time_input)
         self.output_play_button.pressed.connect(self.play_time_output)
         self.input_slider.valueChanged.connect(lambda value: self._on_slider_change(value,isInput=True, signal= self.signal))
@@ -71,142 +98,187 @@ class MainWindow(uiclass, baseclass):
         self.delete_action.triggered.connect(lambda: self.change_mode(self.mode))
         self.current_timer.timeout.connect(lambda: self.update_timer(isInput= True))
         self.output_current_timer.timeout.connect(lambda: self.update_timer(isInput= False))
+        self.recompute_timer.timeout.connect(self.request_recompute)
+        self.recompute_worker.result_ready.connect(self.generate_output_signal)
+        self.import_worker.stage_ready.connect(self._on_import_stage)
+        self.import_cancel_button.clicked.connect(self.cancel_import)
+        self.performance_overlay_action.toggled.connect(self.performance_overlay.setVisible)
+        self.dump_trace_action.triggered.connect(self._dump_performance_trace)
         self.change_window(WindowType.RECTANGLE)
         self.change_mode(ModeType.ANIMALS)
-        
+
+    def closeEvent(self, event):
+        self.stop_input_player()
+        self.stop_stream_player()
+        self.recompute_worker.stop()
+        self.import_worker.stop()
+        # Sessions started with SIGNAL_EQUALIZER_TRACE=<path> leave their trace behind
+        trace_path = os.environ.get('SIGNAL_EQUALIZER_TRACE')
+        if trace_path:
+            PROFILER.dump(trace_path)
+        super().closeEvent(event)
 
     def delete_all(self):
+        self.cancel_import()
+        self.stop_input_player()
+        self.stop_stream_player()
+        self.current_timer.stop()
+        self.output_current_timer.stop()
         self.signal = None
         self.output : Signal = None
-        self.frequencies = None
-        self.original_fourier_transform = None
-        self.fourier_transform = None
+        self.equalizer = None
+        self.preview_equalizer = None
+        self.recompute_timer.stop()
+        self.recompute_worker.set_equalizer(None)
         self.slider_values = []
-        self.magnitude_dB = None
-        self.input_spectrogram_graph.canvas.axes.clear()
-        self.input_spectrogram_graph.canvas.draw()
-        self.output_spectrogram_graph.canvas.axes.clear()
-        self.output_spectrogram_graph.canvas.draw()
+        self.spectrogram = None
+        self.input_spectrogram_graph.clear()
+        self.output_spectrogram_graph.clear()
         self.frequency_graph.clear()
         self.input_signal_graph.clear()
         self.output_signal_graph.clear()
+        self.input_plot.clear()
+        self.output_plot.clear()
     
     def _on_slider_change(self, value, isInput, signal):
         if signal:
             signal.current_time = value / 1000
+            # Seeking while playing moves the running stream, a drag would otherwise reopen it for every value
+            player = self.input_player if isInput else self.stream_player
+            if player is not None:
+                if player.is_active:
+                    player.seek(signal.current_time)
+                else:
+                    player.start(signal.current_time)
             self.update_timer(isInput=isInput)
 
     def _import_signal_file(self):
-        self.signal, self.file_name = get_signal_from_file(self)
-
-        # plot time graph
-        pen_c = pg.mkPen(color=(255, 255, 255))
-        self.input_signal_graph.plot(self.signal.x_vec, self.signal.y_vec, pen=pen_c)
-        self.input_signal_graph.setXRange(self.signal.x_vec[0], self.signal.x_vec[-1])
-        self.input_signal_graph.setYRange(min(self.signal.y_vec), max(self.signal.y_vec))
+        file_path = get_signal_file_path(self)
+        if file_path is None:
+            return
+        # Decoding, transforms and the spectrogram run on the import worker, see _on_import_stage
+        self.change_mode(self.mode)
+        self.import_worker.submit(file_path, self.mode, self.window_type)
+        self.import_progress.setValue(0)
+        self.import_progress.setFormat(f'Loading {os.path.basename(file_path)}')
+        self.import_progress.show()
+        self.import_cancel_button.show()
+
+    def cancel_import(self):
+        self.import_worker.cancel()
+        self.import_progress.hide()
+        self.import_cancel_button.hide()
+
+    def _on_import_stage(self, stage: ImportStage):
+        # Stages of a cancelled or replaced import may still arrive
+        if self.import_worker.is_stale(stage):
+            return
+        if stage.error is not None:
+            self.change_mode(self.mode)
+            QMessageBox.warning(self, 'Import failed', f'{stage.stage} failed: {stage.error}')
+            return
+        functions = {
+            'decode': lambda: self.show_input_signal(*stage.data),
+            'decimate': lambda: self.input_plot.set_pyramid(stage.data),
+            'transform': lambda: self.plot_input_frequency(stage.data),
+            'preview': lambda: self.set_preview_equalizer(stage.data),
+            'spectrogram': lambda: self.plot_input_spectrograph(stage.data),
+        }
+        functions[stage.stage]()
+        done = IMPORT_STAGES.index(stage.stage) + 1
+        self.import_progress.setValue(done)
+        if done == len(IMPORT_STAGES):
+            self.import_progress.hide()
+            self.import_cancel_button.hide()
+
+    def show_input_signal(self, signal: Signal, file_name: str):
+        self.signal, self.file_name = signal, file_name
+        for graph, cursor in ((self.input_signal_graph, self.input_cursor), (self.output_signal_graph, self.output_cursor)):
+            cursor.setValue(self.signal.start_time)
+            if cursor.getViewBox() is None:
+                graph.addItem(cursor)
         self.input_slider.setMinimum(0)
-        self.input_slider.setMaximum(int(self.signal.x_vec[-1] * 1000))
+        self.input_slider.setMaximum(int(self.signal.end_time * 1000))
         self.input_slider.setValue(0)
         self.input_total_time.setText(
-            f'{str(math.floor(self.signal.x_vec[-1] / 60)).zfill(2)}:{str(math.floor(self.signal.x_vec[-1]) % 60).zfill(2)}')
-
-        # plot input frequency graph
-        self.plot_input_frequency()
-        if self.mode == ModeType.UNIFORM:
-            freq_list = []
-            for i in range(10):
-                lower_freq = i * (self.frequencies[-1] / 10)
-                upper_freq = (i + 1) * (self.frequencies[-1] / 10)
-                freq_list.append([lower_freq, upper_freq])
-            self.lower_upper_freq_list = freq_list  
-        abnormalities_dict = {
-        'Abnormality 1': [
-            [0,5],
-            [5, 7],
-            [7,9],
-            [120,180],
-        ],
-        'Abnormality 2': [
-            [0,1],
-            [1, 10],
-            [12,14],
-            [120,180],
-        ],
-        'Abnormality 3':[
-            [0,1],
-            [1, 3],
-            [3,12],
-            [120,180],
-        ],
-        }
-        if self.mode == ModeType.ECG:
-            freq_list = abnormalities_dict[self.file_name]
-            self.lower_upper_freq_list = freq_list     
-        
-        self.plot_input_spectrograph()
-        self.generate_output_signal()  
-        self.perform_window()   
-
-    def plot_input_frequency(self):
-
-        self.frequencies, self.fourier_transform = self.apply_fourier_transform()
-        self.original_fourier_transform = self.fourier_transform.copy()
-
-        # Apply logarithmic transformation to y-axis values
-        self.magnitude_dB = 20 * np.log10(abs(self.fourier_transform))
-
-        # Plot the frequency graph
-        pen_c = pg.mkPen(color=(255, 255, 255))
-        self.frequency_graph.plot(self.frequencies, self.magnitude_dB, pen=pen_c)
-
-        # Optionally, you can set labels for the axes
-        self.frequency_graph.setLabel('left', 'Magnitude (dB)' )
+            f'{str(math.floor(self.signal.end_time / 60)).zfill(2)}:{str(math.floor(self.signal.end_time) % 60).zfill(2)}')
+
+    def _export_output_signal(self):
+        if self.output is None:
+            return
+        try:
+            file_path = save_signal_to_file(self, self.output)
+        except (OSError, ValueError, ImportError) as error:
+            QMessageBox.warning(self, 'Export failed', str(error))
+            return
+        if file_path:
+            self.statusbar.showMessage(f'Exported {file_path}', 5000)
+
+    def _dump_performance_trace(self):
+        file_path, _ = QFileDialog.getSaveFileName(self, 'Dump performance trace', QDir.homePath(), "(*.json)")
+        if not file_path:
+            return
+        try:
+            PROFILER.dump(file_path)
+        except OSError as error:
+            QMessageBox.warning(self, 'Dump failed', str(error))
+            return
+        self.statusbar.showMessage(f'Performance trace written to {file_path}', 5000)
+
+    @profiled('plot_input_frequency')
+    def plot_input_frequency(self, equalizer: Equalizer):
+        self.equalizer = equalizer
+        self.lower_upper_freq_list = equalizer.bands
+
+        # The spectrum is plotted once from the envelope the import worker built. Afterwards only the gain
+        # curve changes, with the envelopes that RecomputeWorker posts.
+        frequencies, magnitude = self.equalizer.get_display_envelope()
+        self.frequency_graph.plot(frequencies, magnitude, pen=pg.mkPen(color=(255, 255, 255)))
+        self.window_plot_scale = np.max(magnitude) / 10
+        self.window_plot_item = self.frequency_graph.plot(frequencies, np.full(len(frequencies), self.window_plot_scale), pen=pg.mkPen(color=(255, 0, 0)))
+        self.frequency_graph.setLabel('left', 'Magnitude')
         self.frequency_graph.setLabel('bottom', 'Frequency', units='Hz')
 
-    def plot_spectrogram(self,canvas,signal,sample_rate,is_csv):
-        canvas.axes.clear()
-        canvas.axes.specgram(signal,Fs=sample_rate)
-
-        canvas.draw()
-
-    def plot_input_spectrograph(self):
-        self.plot_spectrogram(
-            canvas=self.input_spectrogram_graph.canvas,
-            signal=self.signal.y_vec,
-            sample_rate=self.signal.get_sampling_frequency(),
-            is_csv= False
-        )
-
-    def plot_output_spectrograph(self):
-        self.plot_spectrogram(
-            canvas=self.output_spectrogram_graph.canvas,
-            signal=self.output.y_vec,
-            sample_rate=self.signal.get_sampling_frequency(),
-            is_csv= False
-        )
-
+        # The recompute worker applies the current window to it, off the GUI thread
+        self.recompute_worker.set_equalizer(self.equalizer, self.spectrogram, self.preview_equalizer)
+        self.request_recompute()
+
+    def set_preview_equalizer(self, preview_equalizer: Equalizer):
+        # Long signals get a decimated copy that answers slider drags first, see RecomputeWorker
+        self.preview_equalizer = preview_equalizer
+        if self.equalizer is not None and preview_equalizer is not None:
+            self.recompute_worker.set_equalizer(self.equalizer, self.spectrogram, self.preview_equalizer)
+            self.request_recompute()
+
+    @profiled('plot_input_spectrogram')
+    def plot_input_spectrograph(self, spectrogram: Spectrogram):
+        # The input STFT is computed once, output spectrograms reuse it scaled by the band gains
+        self.spectrogram = spectrogram
+        image = self.spectrogram.get_image()
+        self.spectrogram_levels = (np.min(image), np.max(image))
+        self.input_spectrogram_graph.set_image(image, self.spectrogram.rect, self.spectrogram_levels)
+        if self.equalizer is not None:
+            self.recompute_worker.set_equalizer(self.equalizer, self.spectrogram, self.preview_equalizer)
+            self.request_recompute()
+
+    @profiled('plot_output_spectrogram')
+    def plot_output_spectrograph(self, image):
+        # Results computed before the input spectrogram arrived have no output image yet
+        if image is None:
+            return
+        self.output_spectrogram_graph.set_image(image, self.spectrogram.rect, self.spectrogram_levels)
 
-    def apply_fourier_transform(self):
-        sampling_frequency = self.signal.audio.frame_rate if self.signal.audio else self.signal.get_sampling_frequency()
-
-        fourier_transform = np.fft.rfft(self.signal.y_vec)
-        frequencies = np.fft.rfftfreq(len(self.signal.y_vec), d= 1/sampling_frequency)
-        self.phase = np.angle(fourier_transform)
-
-        return frequencies, fourier_transform
 
     def play_time_input(self):
-        if self.signal.audio:
+        if self.signal is not None and self.signal.audio:
             def is_playing_logic():
-                sd.stop()
+                self.stop_input_player()
                 self.signal.is_playing = False
                 self.input_play_button.setText('Play')
                 self.current_timer.stop()
             def is_not_playing_logic():
-                self.audio_thread = Thread(target=lambda: self.play_audio(isInput=True))
-                if self.signal.current_index == 0:
-                    self.input_signal_graph.clear()
-                self.audio_thread.start()
+                self.input_player = StreamPlayer(self.signal)
+                self.input_player.start(self.signal.current_time)
                 self.current_timer.start(100)
                 self.signal.is_playing = True
                 self.input_play_button.setText('Pause')
@@ -221,7 +293,7 @@ class MainWindow(uiclass, baseclass):
     def slider_value_changed(self, index, value):
         self.slider_values[index].setText(f"{value/10}")
         if self.signal:
-            self.perform_window()  
+            self.update_band(index)
 
         
     def delete_sliders(self):  
@@ -242,74 +314,27 @@ class MainWindow(uiclass, baseclass):
         if self.sliders_layout.count() != 0:
             self.delete_sliders()
         self.mode = mode_type
-        def draw_sliders(label_list):
-            for i in range(4):
-                new_vertical_layout = QVBoxLayout()
-                label = QLabel(label_list[i])
-                slider = QSlider()
-                slider.setRange(0,20)
-                slider.setValue(10)
-                value_label = QLabel('1')
-                self.slider_values.append(value_label)
-                new_vertical_layout.addWidget(label)
-                new_vertical_layout.addWidget(slider)
-                new_vertical_layout.addWidget(value_label)
-                self.sliders_layout.addLayout(new_vertical_layout)
-                slider.valueChanged.connect(partial(self.slider_value_changed, i))
-        def animals_logic():
-            freq_list = [
-                [0,450],
-                [450,1100],
-                [1100,3000],
-                [3000,9000],
-             ]
-            label_list = [ 'Dogs', 'Wolves', 'Crow', 'Bat']
-            self.lower_upper_freq_list = freq_list
-            draw_sliders(label_list)
-
-        def music_logic():
-            freq_list = [
-             [0,200],
-            [200,500],
-            [400,800],
-            [800,2200],
-        ]
-            label_list = [ 'Kalimba', 'Guitar', 'Violin', 'Piccolo']
-            self.lower_upper_freq_list = freq_list
-            draw_sliders(label_list)
-
-        def ecg_logic():
-            label_list = [ 'Abnormality 1', 'Abnormality 2', 'Abnormality 3', 'Normal']
-            draw_sliders(label_list)
-
-        def uniform_logic():
-            for i in range(10):
-                new_vertical_layout = QVBoxLayout()
-                label = QLabel(f'Range {i+1}')
-                slider = QSlider()
-                slider.setRange(0,20)
-                slider.setValue(10)
-                value_label = QLabel('1')
-                new_vertical_layout.addWidget(label)
-                new_vertical_layout.addWidget(slider)
-                new_vertical_layout.addWidget(value_label)
-                self.slider_values.append(value_label)
-                self.sliders_layout.addLayout(new_vertical_layout)
-                slider.valueChanged.connect(partial(self.slider_value_changed, i))
-
-        mode_dict = {
-            ModeType.ANIMALS: lambda: animals_logic(),
-            ModeType.MUSIC: lambda: music_logic(),
-            ModeType.ECG: lambda: ecg_logic(),
-            ModeType.UNIFORM: lambda: uniform_logic(),
-        }    
-        mode_dict[self.mode]()
+        for i, label_text in enumerate(MODE_LABELS[self.mode]):
+            new_vertical_layout = QVBoxLayout()
+            label = QLabel(label_text)
+            slider = QSlider()
+            slider.setRange(0,20)
+            slider.setValue(10)
+            value_label = QLabel('1')
+            self.slider_values.append(value_label)
+            new_vertical_layout.addWidget(label)
+            new_vertical_layout.addWidget(slider)
+            new_vertical_layout.addWidget(value_label)
+            self.sliders_layout.addLayout(new_vertical_layout)
+            slider.valueChanged.connect(partial(self.slider_value_changed, i))
 
 
     def change_window(self, window_type):
         self.window_type = window_type
+        if self.stream_player is not None:
+            self.stream_player.block_equalizer.set_window_type(window_type)
         if self.signal is not None: 
-            self.perform_window()
+            self.request_recompute()
         self.gaussian_button.setStyleSheet("")
         self.hamming_button.setStyleSheet("")
         self.rectangle_button.setStyleSheet("")
@@ -324,137 +349,79 @@ class MainWindow(uiclass, baseclass):
         functions[self.window_type]()
 
 
-    def perform_window(self):
-        total = len(self.slider_values)
-        result = self.original_fourier_transform
-        all_wave = np.array([])
-        window_plot = np.array([])
-        for i in range(total):
-            lower_freq = self.lower_upper_freq_list[i][0]
-            upper_freq = self.lower_upper_freq_list[i][1]
-            amplitude = float(self.slider_values[i].text())
-            if self.mode == ModeType.ECG:
-                amplitude = 2 - amplitude
-            freq_range_mask = self.frequencies[(self.frequencies >= lower_freq) & (self.frequencies <= upper_freq)]
-            fourier_transform_mask = self.original_fourier_transform[(self.frequencies >= lower_freq) & (self.frequencies <= upper_freq)]
-            functions = {
-                WindowType.GAUSSIAN: lambda : gaussian(len(fourier_transform_mask), np.std(self.frequencies)) * amplitude,
-                WindowType.RECTANGLE: lambda : np.ones(len(fourier_transform_mask)) * amplitude,
-                WindowType.HAMMING: lambda : np.hamming(len(fourier_transform_mask)) * amplitude,
-                WindowType.HANNING: lambda : np.hanning(len(fourier_transform_mask)) * amplitude,
-            }
-            signal = functions[self.window_type]()
-
-            result = np.where(freq_range_mask, fourier_transform_mask * signal, fourier_transform_mask)
-            all_wave = np.concatenate((all_wave, result))
-            window_plot = np.concatenate((window_plot, signal))
-
-        if len(all_wave) > len(self.fourier_transform):
-            self.fourier_transform = all_wave[:len(self.fourier_transform)]
-        else:    
-            self.fourier_transform[:len(all_wave)] = all_wave
-        self.frequency_graph.clear()
-        self.frequency_graph.plot(self.frequencies, abs(self.original_fourier_transform.real))
-        pen_c = pg.mkPen(color=(255, 0, 0))
-        if len(window_plot) > len(self.frequencies):
-            self.frequency_graph.plot(self.frequencies,window_plot[:len(self.frequencies)] * (max(self.original_fourier_transform.real)/10),pen= pen_c)
-        else:  
-            self.frequency_graph.plot(self.frequencies[:len(window_plot)],window_plot * (max(self.original_fourier_transform.real)/10),pen= pen_c)
-        self.generate_output_signal()
-
-
-    def generate_output_signal(self):
-        self.output_signal_graph.clear()
-        pen_c = pg.mkPen(color=(255, 255, 255))
-        
-        # Generate output using inverse Fourier transform of self.frequency and self.fourier_transform
-        if self.fourier_transform is not None:
-            if self.mode == ModeType.ECG:
-                data = (np.abs(self.fourier_transform) * np.exp(1j  * self.phase[:len(self.fourier_transform)]))
-                y_vec = (np.fft.irfft(data).real) 
-                x_vec = self.signal.x_vec[:len(y_vec)]
-            else:    
-                data = np.fft.irfft(self.fourier_transform).real
-                y_vec = np.int16(data) 
-                x_vec = self.signal.x_vec[:len(y_vec)]
-            
-            self.output_signal_graph.plot(x_vec, y_vec, pen=pen_c)
-            self.output_signal_graph.repaint()
-            self.output_signal_graph.setXRange(x_vec[0], x_vec[-1])
-            self.output_signal_graph.setYRange(min(y_vec), max(y_vec))
-            if self.signal.audio is not None:
-                y_vec = np.int16(y_vec)
-                audio = AudioSegment(
-                y_vec.astype(np.int16).tobytes(),
-                frame_rate= None if self.signal.audio is None else self.signal.audio.frame_rate,
-                sample_width=2,
-                channels=1  
-            )
-                self.output = Signal(x_vec, y_vec, audio)
-
-            else:
-                self.output = Signal(x_vec, y_vec, audio= None)
+    def slider_gains(self):
+        gains = [float(value_label.text()) for value_label in self.slider_values]
+        if self.mode == ModeType.ECG:
+            gains = [2 - gain for gain in gains]
+        return gains
+
+    def update_band(self, index):
+        # The streamed output reads its gains on every block, so the change is heard right away
+        if self.stream_player is not None:
+            self.stream_player.block_equalizer.gains[index] = self.slider_gains()[index]
+        # Restarting the timer coalesces a slider drag into a single recompute of its final value
+        self.recompute_timer.start()
+
+    def request_recompute(self):
+        if self.equalizer is not None:
+            self.recompute_worker.submit(self.window_type, self.slider_gains())
+
+
+    @profiled('generate_output_signal')
+    def generate_output_signal(self, result: RecomputeResult):
+        # Stale results of a previous signal may still arrive after a new import or a delete
+        if self.recompute_worker.is_stale(result) or self.equalizer is None:
+            return
+        self.window_plot_item.setData(result.frequencies, result.window_plot * self.window_plot_scale)
+        if result.preview:
+            # Only the plots show the decimated output, playback and export wait for the full-rate one
+            self.output_plot.set_pyramid(result.pyramid)
+            self.plot_output_spectrograph(result.spectrogram)
+            return
+
+        # The output and its min/max pyramid were built by the recompute worker from the equalized spectrum
+        if result.output is not None:
+            previous_output = self.output
+            self.output = result.output
+            self.output_plot.set_pyramid(result.pyramid)
 
-            sd.stop()
-            self.output.is_playing = False
-            self.output_play_button.setText('Play')
-            self.output_current_timer.stop()
-            self.output_current_timer.stop()
-            self.output.current_time = 0
-            self.output.current_index = 0
             self.output_slider.setMinimum(0)
-            self.output_slider.setMaximum(int(self.output.x_vec[-1] * 1000))
-            self.output_slider.blockSignals(True)
-            self.output_slider.setValue(0)
-            self.output_slider.blockSignals(False)
+            self.output_slider.setMaximum(int(self.output.end_time * 1000))
+            if previous_output is not None and previous_output.is_playing:
+                # Streaming playback already follows the new gains, so it keeps playing from where it is
+                self.output.is_playing = True
+                self.output.current_time = previous_output.current_time
+            else:
+                self.output.is_playing = False
+                self.output_play_button.setText('Play')
+                self.output_current_timer.stop()
+                self.output.current_time = 0
+                self.output_slider.blockSignals(True)
+                self.output_slider.setValue(0)
+                self.output_slider.blockSignals(False)
+                self.output_cursor.setValue(0)
             self.output_total_time.setText(
-            f'{str(math.floor(self.output.x_vec[-1] / 60)).zfill(2)}:{str(math.floor(self.output.x_vec[-1]) % 60).zfill(2)}')
-            self.plot_output_spectrograph()
-
-
-    def play_audio(self, isInput):
-        signal = self.signal if isInput else self.output
-        def input_logic():
-            self.signal.is_playing = True
-            return self.input_play_button
-        def output_logic():
-             self.output.is_playing = True
-             return self.output_play_button
-        
-        fun_dict = {
-            True: lambda: input_logic(),
-            False: lambda: output_logic(),
-        }
-        
-        if signal.audio:
-            button = fun_dict[isInput]()
-            final_index = np.abs(signal.x_vec - signal.current_time).argmin()
-            sd.play(signal.y_vec[final_index:], signal.audio.frame_rate * 2)
-            sd.wait()
-            self.current_timer.stop() if isInput else self.output_current_timer.stop()
-            signal.is_playing = False
-            
-            if final_index >= len(signal.x_vec) - 100:
-                button.setText('Rewind')
-                signal.current_time = 0
-                signal.current_index = 0
-
+            f'{str(math.floor(self.output.end_time / 60)).zfill(2)}:{str(math.floor(self.output.end_time) % 60).zfill(2)}')
+            self.plot_output_spectrograph(result.spectrogram)
 
 
     def play_time_output(self):
         if self.output is not None and self.signal.audio:
 
             def is_playing_logic():
-                sd.stop()
+                self.stop_stream_player()
                 self.output.is_playing = False
                 self.output_play_button.setText('Play')
                 self.output_current_timer.stop()
 
             def is_not_playing_logic():
-                self.output_audio_thread = Thread(target=lambda: self.play_audio(isInput=False))
-                if self.output.current_index == 0:
-                    self.output_signal_graph.clear()
-                self.output_audio_thread.start()
+                audio = self.signal.audio
+                # Gaussian bands keep the width they have in the plotted and exported output
+                window_std = get_window_std(self.equalizer.fft_length, audio.frame_rate, 2 * STREAM_BLOCK_SIZE)
+                block_equalizer = BlockEqualizer(self.lower_upper_freq_list, audio.frame_rate, self.window_type, channels=self.signal.channels, window_std=window_std)
+                block_equalizer.gains[:] = self.slider_gains()
+                self.stream_player = StreamPlayer(self.signal, block_equalizer)
+                self.stream_player.start(self.output.current_time)
                 self.output_current_timer.start(100)
                 self.output.is_playing = True
                 self.output_play_button.setText('Pause')
@@ -466,24 +433,45 @@ class MainWindow(uiclass, baseclass):
             functions[self.output.is_playing]()
 
 
+    def stop_stream_player(self):
+        if self.stream_player is not None:
+            self.stream_player.stop()
+            self.stream_player = None
+
+    def stop_input_player(self):
+        if self.input_player is not None:
+            self.input_player.stop()
+            self.input_player = None
+
+    def finish_playback(self, isInput):
+        signal = self.signal if isInput else self.output
+        if isInput:
+            self.stop_input_player()
+            self.current_timer.stop()
+            self.input_play_button.setText('Rewind')
+        else:
+            self.stop_stream_player()
+            self.output_current_timer.stop()
+            self.output_play_button.setText('Rewind')
+        signal.is_playing = False
+        signal.current_time = 0
+
+    @profiled('update_timer')
     def update_timer(self, isInput):
-        def is_input_logic():
-            signal = self.signal
-            graph = self.input_signal_graph
-            return signal, graph
-        
-        def is_output_logic():
-            signal = self.output
-            graph = self.output_signal_graph
-            return signal, graph
-        
-        functions = {
-            True: lambda: is_input_logic(),
-            False: lambda: is_output_logic(),
-        }
-        signal, graph = functions[isInput]()
+        # Only moves the playback cursor, so a tick costs the same at any point of any track
+        signal = self.signal if isInput else self.output
+        player = self.input_player if isInput else self.stream_player
+        cursor = self.input_cursor if isInput else self.output_cursor
+
+        if player is not None:
+            if not player.is_active:
+                # The stream reached the end of the signal
+                self.finish_playback(isInput)
+                cursor.setValue(signal.current_time)
+                return
+            # Position of the stream, not an estimate from the timer interval
+            signal.current_time = player.current_time
 
-        signal.current_time += 0.1    
         current_text = self.current_input_time if isInput else self.current_output_time
         current_slider = self.input_slider if isInput else self.output_slider
 
@@ -492,10 +480,7 @@ class MainWindow(uiclass, baseclass):
         current_slider.blockSignals(True)
         current_slider.setValue(math.ceil(signal.current_time * 1000))
         current_slider.blockSignals(False)
-        current_slider.repaint()
-        old_current_output_index = signal.current_index
-        signal.current_index += math.ceil(len(signal.x_vec) / (signal.x_vec[-1] * 10))
-        graph.plot(signal.x_vec[old_current_output_index:signal.current_index], signal.y_vec[old_current_output_index:signal.current_index])
+        cursor.setValue(signal.current_time)
 
 
 
@@ -0,0 +1,69 @@
+import numpy as np
+
+from managers.equalizer import fill_gain_curve, get_band_slices, get_band_windows
+from models.equalizer_mode import WindowType
+
+STREAM_BLOCK_SIZE = 1024
+
+
+def get_window_std(sample_count: int, sample_rate: float, frame_size: int) -> float:
+    # Equalizer passes the std of its bin frequencies to the gaussian window as a std in bins, so the
+    # window's width in Hz depends on the transform length. This is the std in bins of a frame_size
+    # transform that gives the same width as a transform of the whole signal. The std of the
+    # sample_count // 2 + 1 evenly spaced bin frequencies is computed without building them.
+    bins_count = sample_count // 2 + 1
+    bin_width = sample_rate / sample_count
+    return bin_width * np.sqrt((bins_count ** 2 - 1) / 12) * frame_size / sample_count
+
+
+class BlockEqualizer:
+    """Short-time Fourier equalizer for streamed blocks.
+
+    Frames of two blocks are weighted by a square-root Hann window at 50% overlap, equalized in the
+    frequency domain and overlap-added, which reconstructs the input exactly at unit gain with one
+    block of latency. `gains` is read on every block, so it can be written from another thread.
+    Blocks are (block_size,) for one channel or (block_size, channels) otherwise. window_std is the
+    gaussian window's std in bins, the std of the frame's bin frequencies by default.
+    """
+
+    def __init__(self, bands: list, sample_rate: float, window_type: WindowType = WindowType.RECTANGLE, block_size: int = STREAM_BLOCK_SIZE, channels: int = 1, window_std: float = None) -> None:
+        self.block_size = block_size
+        self.frame_size = 2 * block_size
+        self.channels = channels
+        self.window = np.sqrt(np.hanning(self.frame_size + 1)[:-1])
+        if channels > 1:
+            self.window = self.window[:, np.newaxis]
+        self.frequencies = np.fft.rfftfreq(self.frame_size, d=1 / sample_rate)
+        self.band_slices = get_band_slices(self.frequencies, bands)
+        self.window_std = np.std(self.frequencies) if window_std is None else window_std
+        self.band_windows = []
+        self.window_type = None
+        self.gains = np.ones(len(bands))
+        self.curve = np.ones(len(self.frequencies))
+        self.set_window_type(window_type)
+        block_shape = (block_size,) if channels == 1 else (block_size, channels)
+        self.input_tail = np.zeros(block_shape)
+        self.output_tail = np.zeros(block_shape)
+
+    def set_window_type(self, window_type: WindowType):
+        if window_type != self.window_type:
+            self.window_type = window_type
+            self.band_windows = get_band_windows(window_type, self.band_slices, self.window_std)
+
+    def gain_curve(self) -> np.ndarray:
+        fill_gain_curve(self.curve, slice(0, len(self.frequencies)), self.band_slices, self.band_windows, self.gains)
+        return self.curve if self.channels == 1 else self.curve[:, np.newaxis]
+
+    def reset(self):
+        self.input_tail[:] = 0
+        self.output_tail[:] = 0
+
+    def process(self, block: np.ndarray) -> np.ndarray:
+        frame = np.concatenate((self.input_tail, block))
+        self.input_tail[:] = block
+        spectrum = np.fft.rfft(frame * self.window, axis=0)
+        spectrum *= self.gain_curve()
+        equalized = np.fft.irfft(spectrum, n=self.frame_size, axis=0) * self.window
+        output = self.output_tail + equalized[:self.block_size]
+        self.output_tail[:] = equalized[self.block_size:]
+        return output
@@ -0,0 +1,337 @@
+import os
+from dataclasses import dataclass
+from functools import lru_cache
+
+import numpy as np
+
+from helpers.spectrum_cache import get_spectrum_cache, get_spectrum_key
+from managers import fft_backend
+from managers.min_max_pyramid import get_min_max_envelope
+from models.signal import Signal, AudioInfo
+from models.equalizer_mode import ModeType, WindowType
+
+# Cached per-band time-domain components are only kept while they fit in this many bytes
+INCREMENTAL_SYNTHESIS_MEMORY_BUDGET = 512 * 1024 ** 2
+# Number of incremental updates after which the output is resynthesized exactly to drop accumulated round-off
+EXACT_RECOMPUTE_INTERVAL = 32
+# Spectrum and gain curve plots are reduced to a min/max envelope of this many runs of bins
+DISPLAY_SPECTRUM_WIDTH = 2048
+# Batched preset evaluation synthesizes as many presets at once as fit in this many bytes of spectra
+PRESET_EVALUATION_CHUNK_BYTES = 256 * 1024 ** 2
+# Sample dtype of the equalizer's buffers, spectra use the matching complex dtype. Single precision halves
+# the memory and bandwidth of every stage.
+PRECISIONS = {
+    'double': np.float64,
+    'single': np.float32,
+}
+# Single precision outputs stay within this RMS error of the double precision ones, relative to their RMS
+SINGLE_PRECISION_TOLERANCE = 1e-5
+
+_precision: np.dtype = None
+
+
+def set_precision(name: str) -> np.dtype:
+    global _precision
+    if name not in PRECISIONS:
+        raise ValueError(f"Unknown precision '{name}', expected one of {list(PRECISIONS)}")
+    _precision = np.dtype(PRECISIONS[name])
+    return _precision
+
+
+def get_precision() -> np.dtype:
+    # Picked from SIGNAL_EQUALIZER_PRECISION on first use, double by default
+    if _precision is None:
+        set_precision(os.environ.get('SIGNAL_EQUALIZER_PRECISION', 'double'))
+    return _precision
+
+
+def apply_fourier_transform(signal: Signal, y_vec: np.ndarray = None, n: int = None):
+    # Multi-channel samples are (n_frames, n_channels), every channel is transformed along the frames axis.
+    # A length n larger than the signal zero-pads it.
+    sampling_frequency = signal.get_sampling_frequency()
+    y_vec = signal.y_vec if y_vec is None else y_vec
+    n = len(y_vec) if n is None else n
+
+    fourier_transform = fft_backend.rfft(y_vec, n=n, axis=0)
+    frequencies = np.fft.rfftfreq(n, d=1 / sampling_frequency)
+
+    return frequencies, fourier_transform
+
+
+def get_signal_spectrum(signal: Signal, y_vec: np.ndarray, n: int, downmix: bool = False):
+    # Same as apply_fourier_transform, but signals loaded from a file reuse the spectrum cached for its
+    # content, so re-importing it or switching modes skips the FFT. The returned spectrum is read-only.
+    if signal.content_key is None:
+        return apply_fourier_transform(signal, y_vec, n)
+    sampling_frequency = signal.get_sampling_frequency()
+    # Single precision samples have their own complex64 spectra, every other dtype is transformed in double
+    precision = np.float32 if y_vec.dtype == np.float32 else np.float64
+    spectrum_key = get_spectrum_key(signal.content_key, n, sampling_frequency, downmix, precision)
+    cache = get_spectrum_cache()
+    fourier_transform = cache.get_spectrum(spectrum_key)
+    if fourier_transform is None:
+        _, fourier_transform = apply_fourier_transform(signal, y_vec, n)
+        cache.put_spectrum(spectrum_key, fourier_transform)
+    return np.fft.rfftfreq(n, d=1 / sampling_frequency), fourier_transform
+
+
+def get_window(window_type: WindowType, length: int, std: float) -> np.ndarray:
+    # Only the gaussian depends on std, leaving it out of the other keys lets them share cache entries
+    return _get_cached_window(window_type, length, std if window_type == WindowType.GAUSSIAN else None)
+
+
+def _get_gaussian_window(length: int, std: float) -> np.ndarray:
+    # scipy.signal takes most of a second to import, it is only loaded once a gaussian window is needed
+    from scipy.signal.windows import gaussian
+    return gaussian(length, std)
+
+
+@lru_cache(maxsize=256)
+def _get_cached_window(window_type: WindowType, length: int, std: float) -> np.ndarray:
+    functions = {
+        WindowType.GAUSSIAN: lambda: _get_gaussian_window(length, std),
+        WindowType.RECTANGLE: lambda: np.ones(length),
+        WindowType.HAMMING: lambda: np.hamming(length),
+        WindowType.HANNING: lambda: np.hanning(length),
+    }
+    window = functions[window_type]()
+    # Cached windows are shared between every equalizer, so they must never be modified in place
+    window.flags.writeable = False
+    return window
+
+
+def get_band_slices(frequencies: np.ndarray, bands: list) -> list:
+    # frequencies are sorted, so every band [lower, upper] is one contiguous run of bins
+    lower_bins = np.searchsorted(frequencies, [band[0] for band in bands], side='left')
+    upper_bins = np.searchsorted(frequencies, [band[1] for band in bands], side='right')
+    return [slice(int(lower), int(upper)) for lower, upper in zip(lower_bins, upper_bins)]
+
+
+def get_band_windows(window_type: WindowType, band_slices: list, std: float) -> list:
+    return [get_window(window_type, band_slice.stop - band_slice.start, std) for band_slice in band_slices]
+
+
+def fill_gain_curve(curve: np.ndarray, bins: slice, band_slices: list, band_windows: list, gains) -> np.ndarray:
+    # Writes the product of every band's scaled window into curve[bins], without temporary arrays.
+    # Bins outside of every band keep a gain of 1 and overlapping bands multiply.
+    curve[bins] = 1
+    for band_slice, window, gain in zip(band_slices, band_windows, gains):
+        start, stop = max(bins.start, band_slice.start), min(bins.stop, band_slice.stop)
+        if start < stop:
+            band_curve = curve[start:stop]
+            band_curve *= window[start - band_slice.start:stop - band_slice.start]
+            band_curve *= gain
+    return curve
+
+
+def get_gain_curves(bins_count: int, band_slices: list, band_windows: list, gain_matrix: np.ndarray, dtype=np.float64) -> np.ndarray:
+    # (presets x bins) gain curves of a (presets x bands) gain matrix, fill_gain_curve for every row at once
+    curves = np.ones((len(gain_matrix), bins_count), dtype=dtype)
+    for band, (band_slice, window) in enumerate(zip(band_slices, band_windows)):
+        curves[:, band_slice] *= gain_matrix[:, band, np.newaxis] * window
+    return curves
+
+
+@dataclass
+class PresetEvaluation:
+    # outputs is (presets, *signal shape). Band energies sum |spectrum|^2 over each band's bins and
+    # channels, band_gains_db compares them to the unequalized signal's.
+    outputs: np.ndarray
+    band_energies: np.ndarray
+    band_gains_db: np.ndarray
+
+
+class Equalizer:
+    """GUI-free equalizer: holds the spectrum of a signal and rebuilds the output for a set of band gains.
+
+    Multi-channel signals are equalized per channel, unless downmix is set, in which case the channels
+    are averaged first and a single mono spectrum is processed. With pad_to_fast_length the signal is
+    zero-padded to the next length the FFT handles quickly, and outputs are trimmed back to its length.
+    Spectra, gain curves and outputs are computed in dtype, get_precision() by default.
+    """
+
+    def __init__(self, signal: Signal, bands: list, mode: ModeType = ModeType.ANIMALS, window_type: WindowType = WindowType.RECTANGLE, incremental: bool = False, downmix: bool = False, pad_to_fast_length: bool = False, dtype=None) -> None:
+        self.signal = signal
+        self.incremental = incremental
+        self.mode = mode
+        self.window_type = window_type
+        self.dtype = get_precision() if dtype is None else np.dtype(dtype)
+        self.y_vec = signal.get_mono() if downmix else signal.y_vec
+        self.fft_length = fft_backend.fast_length(len(self.y_vec)) if pad_to_fast_length else len(self.y_vec)
+        # The FFT promotes integer samples to double precision, single precision converts them first
+        samples = self.y_vec.astype(self.dtype, copy=False) if self.dtype == np.float32 else self.y_vec
+        self.frequencies, self.original_fourier_transform = get_signal_spectrum(signal, samples, self.fft_length, downmix)
+        self.phase = np.angle(self.original_fourier_transform)
+        self.fourier_transform = self.original_fourier_transform.copy()
+        self.window_plot = np.ones(len(self.frequencies), dtype=self.dtype)
+        self._display_envelope = None
+        self.band_slices = []
+        self.band_windows = []
+        # Incremental synthesis state, see _build_components
+        self.components = None
+        self.component_bands = []
+        self.component_gains = []
+        self.output_y_vec = None
+        self.updates_since_exact = 0
+        self.set_bands(bands)
+
+    def get_display_spectrum(self) -> np.ndarray:
+        # Channel average of the original spectrum, for plotting
+        if self.original_fourier_transform.ndim == 1:
+            return self.original_fourier_transform
+        return self.original_fourier_transform.mean(axis=1)
+
+    def get_display_envelope(self):
+        # (frequencies, magnitudes) envelope of the display spectrum, built on first use and kept
+        if self._display_envelope is None:
+            self._display_envelope = get_min_max_envelope(self.frequencies, np.abs(self.get_display_spectrum().real), DISPLAY_SPECTRUM_WIDTH)
+        return self._display_envelope
+
+    def get_display_window_plot(self):
+        # (frequencies, gains) envelope of the current gain curve, on the same bins as the display spectrum
+        return get_min_max_envelope(self.frequencies, self.window_plot, DISPLAY_SPECTRUM_WIDTH)
+
+    def set_bands(self, bands: list):
+        self.bands = bands
+        self.gains = [1.0] * len(bands)
+        self.band_slices = get_band_slices(self.frequencies, bands)
+        self._build_band_windows()
+
+    def set_window_type(self, window_type: WindowType):
+        if window_type != self.window_type:
+            self.window_type = window_type
+            self._build_band_windows()
+
+    def _build_band_windows(self):
+        self.band_windows = get_band_windows(self.window_type, self.band_slices, np.std(self.frequencies))
+        self._update_bins(slice(0, len(self.frequencies)))
+        if self.incremental:
+            self._build_components()
+
+    def _update_bins(self, bins: slice):
+        # Rebuild the gain curve over bins, then apply it to the spectrum with a single multiply
+        fill_gain_curve(self.window_plot, bins, self.band_slices, self.band_windows, self.gains)
+        np.multiply(self.original_fourier_transform[bins], self._per_channel(self.window_plot[bins]), out=self.fourier_transform[bins])
+
+    def _per_channel(self, curve: np.ndarray) -> np.ndarray:
+        # Broadcasts a gain curve over the channels axis of the spectrum
+        return curve if self.original_fourier_transform.ndim == 1 else curve[:, np.newaxis]
+
+    def set_gain(self, index: int, gain: float) -> np.ndarray:
+        if gain != self.gains[index]:
+            self.gains[index] = gain
+            self._update_bins(self.band_slices[index])
+            if self.components is not None:
+                self._update_components(index)
+        return self.fourier_transform
+
+    def perform_window(self, gains) -> np.ndarray:
+        self.gains = list(gains)
+        self._update_bins(slice(0, len(self.frequencies)))
+        if self.components is not None:
+            self.component_gains = [self._component_gain(bands) for bands in self.component_bands]
+            self._recompute_exact()
+        return self.fourier_transform
+
+    def _component_gain(self, band_indices) -> float:
+        return float(np.prod([self.gains[i] for i in band_indices]))
+
+    def _build_components(self):
+        # The output is linear in the spectrum, so it is split at every band edge into segments whose
+        # gain is the product of the covering bands' slider gains. Each segment's unit-gain time-domain
+        # component is cached, and a slider move only adds (new - old) gain times the segments it covers.
+        edges = sorted({0, len(self.frequencies)} | {edge for band_slice in self.band_slices for edge in (band_slice.start, band_slice.stop)})
+        segments = []
+        for start, stop in zip(edges, edges[1:]):
+            bands = [i for i, band_slice in enumerate(self.band_slices) if band_slice.start <= start and stop <= band_slice.stop]
+            if bands and start < stop:
+                segments.append((slice(start, stop), bands))
+
+        if (len(segments) + 1) * self.y_vec.size * self.dtype.itemsize > INCREMENTAL_SYNTHESIS_MEMORY_BUDGET:
+            self.components = None
+            return
+
+        self.components = np.empty((len(segments),) + self.y_vec.shape, dtype=self.dtype)
+        self.component_bands = [bands for _, bands in segments]
+        unit_spectrum = np.zeros_like(self.original_fourier_transform)
+        for component, (segment, bands) in zip(self.components, segments):
+            unit_spectrum[segment] = self._unit_segment(segment, bands)
+            component[:] = self._synthesize(unit_spectrum)
+            unit_spectrum[segment] = 0
+        self.component_gains = [self._component_gain(bands) for bands in self.component_bands]
+        self._recompute_exact()
+
+    def _unit_segment(self, segment: slice, bands: list) -> np.ndarray:
+        window = np.ones(segment.stop - segment.start, dtype=self.dtype)
+        for i in bands:
+            band_slice = self.band_slices[i]
+            window *= self.band_windows[i][segment.start - band_slice.start:segment.stop - band_slice.start]
+        return self.original_fourier_transform[segment] * self._per_channel(window)
+
+    def _update_components(self, index: int):
+        self.updates_since_exact += 1
+        exact = self.updates_since_exact >= EXACT_RECOMPUTE_INTERVAL
+        for i, bands in enumerate(self.component_bands):
+            if index in bands:
+                gain = self._component_gain(bands)
+                if not exact:
+                    self.output_y_vec += (gain - self.component_gains[i]) * self.components[i]
+                self.component_gains[i] = gain
+        if exact:
+            self._recompute_exact()
+
+    def _recompute_exact(self):
+        self.output_y_vec = self._synthesize(self.fourier_transform)
+        self.updates_since_exact = 0
+
+    def _synthesize(self, spectrum: np.ndarray) -> np.ndarray:
+        # Inverse transform at the (possibly padded) FFT length, trimmed back to the signal's samples
+        return fft_backend.irfft(spectrum, n=self.fft_length, axis=0)[:len(self.y_vec)]
+
+    def generate_output_signal(self) -> Signal:
+        if self.components is not None:
+            y_vec = self.output_y_vec.copy()
+        elif self.mode == ModeType.ECG:
+            data = np.exp(1j * self.phase)
+            data *= np.abs(self.fourier_transform)
+            y_vec = self._synthesize(data)
+        else:
+            y_vec = self._synthesize(self.fourier_transform)
+        if self.signal.audio is None:
+            return self.signal.derive(y_vec)
+
+        # Samples stay float in the input's scale, they are only converted to PCM when exported
+        audio = self.signal.audio
+        audio_info = AudioInfo(audio.frame_rate, audio.sample_width, 1 if y_vec.ndim == 1 else y_vec.shape[1], getattr(audio, 'is_float', False))
+        return self.signal.derive(y_vec, audio_info)
+
+    def evaluate_presets(self, gain_matrix) -> PresetEvaluation:
+        """Equalizes the signal with every row of a (presets x bands) gain matrix in batched passes.
+
+        The equalizer's own gains and output are left untouched.
+        """
+        gain_matrix = np.atleast_2d(np.asarray(gain_matrix, dtype=np.float64))
+        curves = get_gain_curves(len(self.frequencies), self.band_slices, self.band_windows, gain_matrix, self.dtype)
+
+        power = np.square(np.abs(self.original_fourier_transform))
+        if power.ndim > 1:
+            power = power.sum(axis=1)
+        band_energies = np.stack([np.square(curves[:, band_slice]) @ power[band_slice] for band_slice in self.band_slices], axis=1)
+        original_energies = np.array([power[band_slice].sum() for band_slice in self.band_slices])
+        with np.errstate(divide='ignore', invalid='ignore'):
+            band_gains_db = 10 * np.log10(band_energies / original_energies)
+
+        outputs = np.empty((len(gain_matrix),) + self.y_vec.shape, dtype=self.dtype)
+        chunk = max(1, PRESET_EVALUATION_CHUNK_BYTES // max(self.original_fourier_transform.nbytes, 1))
+        for start in range(0, len(gain_matrix), chunk):
+            chunk_curves = curves[start:start + chunk]
+            if self.original_fourier_transform.ndim > 1:
+                chunk_curves = chunk_curves[:, :, np.newaxis]
+            spectra = self.original_fourier_transform * chunk_curves
+            # One inverse transform along the bins axis for the whole chunk of presets
+            outputs[start:start + chunk] = fft_backend.irfft(spectra, n=self.fft_length, axis=1)[:, :len(self.y_vec)]
+        return PresetEvaluation(outputs, band_energies, band_gains_db)
+
+    def equalize(self, gains) -> Signal:
+        self.perform_window(gains)
+        return self.generate_output_signal()
@@ -0,0 +1,122 @@
+import atexit
+import os
+import zipfile
+from abc import ABC, abstractmethod
+
+import numpy as np
+
+from helpers.signal_cache import CACHE_DIR
+
+# scipy.fft and pyFFTW are imported when their backend is created, the first time a transform runs
+
+
+# Interface that describes how FFT backends should be implemented
+class IFFTBackend(ABC):
+    @abstractmethod
+    def rfft(self, x: np.ndarray, n: int = None, axis: int = 0) -> np.ndarray:
+        pass
+
+    @abstractmethod
+    def irfft(self, x: np.ndarray, n: int = None, axis: int = 0) -> np.ndarray:
+        pass
+
+
+class NumpyFFTBackend(IFFTBackend):
+    # numpy.fft always runs on one thread
+    def __init__(self, threads: int = 1) -> None:
+        pass
+
+    def rfft(self, x: np.ndarray, n: int = None, axis: int = 0) -> np.ndarray:
+        return np.fft.rfft(x, n=n, axis=axis)
+
+    def irfft(self, x: np.ndarray, n: int = None, axis: int = 0) -> np.ndarray:
+        return np.fft.irfft(x, n=n, axis=axis)
+
+
+class ScipyFFTBackend(IFFTBackend):
+    # scipy.fft splits multi-channel and batched transforms over every core by default
+    def __init__(self, threads: int = -1) -> None:
+        import scipy.fft
+        self.fft = scipy.fft
+        self.workers = threads
+
+    def rfft(self, x: np.ndarray, n: int = None, axis: int = 0) -> np.ndarray:
+        return self.fft.rfft(x, n=n, axis=axis, workers=self.workers)
+
+    def irfft(self, x: np.ndarray, n: int = None, axis: int = 0) -> np.ndarray:
+        return self.fft.irfft(x, n=n, axis=axis, workers=self.workers)
+
+
+class PyFFTWBackend(IFFTBackend):
+    # FFTW plans are cached in memory and their wisdom is kept on disk between runs. The wisdom is a tuple
+    # of byte strings, stored as uint8 arrays of an .npz so loading it never unpickles anything.
+    def __init__(self, threads: int = None, wisdom_path: str = os.path.join(CACHE_DIR, 'fftw_wisdom.npz')) -> None:
+        try:
+            import pyfftw
+            import pyfftw.interfaces.scipy_fft
+        except ImportError:
+            raise ImportError('pyFFTW is not installed')
+        self.pyfftw = pyfftw
+        self.threads = threads or os.cpu_count()
+        self.wisdom_path = wisdom_path
+        self.pyfftw.interfaces.cache.enable()
+        try:
+            with np.load(wisdom_path, allow_pickle=False) as wisdom_file:
+                wisdom = tuple(wisdom_file[f'arr_{i}'].tobytes() for i in range(len(wisdom_file.files)))
+            self.pyfftw.import_wisdom(wisdom)
+        except (OSError, ValueError, KeyError, zipfile.BadZipFile):
+            pass
+        atexit.register(self.save_wisdom)
+
+    def save_wisdom(self):
+        try:
+            os.makedirs(os.path.dirname(self.wisdom_path), exist_ok=True)
+            with open(self.wisdom_path, 'wb') as wisdom_file:
+                np.savez(wisdom_file, *[np.frombuffer(wisdom, dtype=np.uint8) for wisdom in self.pyfftw.export_wisdom()])
+        except OSError:
+            pass
+
+    def rfft(self, x: np.ndarray, n: int = None, axis: int = 0) -> np.ndarray:
+        return self.pyfftw.interfaces.scipy_fft.rfft(x, n=n, axis=axis, workers=self.threads)
+
+    def irfft(self, x: np.ndarray, n: int = None, axis: int = 0) -> np.ndarray:
+        return self.pyfftw.interfaces.scipy_fft.irfft(x, n=n, axis=axis, workers=self.threads)
+
+
+FFT_BACKENDS = {
+    'numpy': NumpyFFTBackend,
+    'scipy': ScipyFFTBackend,
+    'pyfftw': PyFFTWBackend,
+}
+
+_backend: IFFTBackend = None
+
+
+def set_fft_backend(name: str, threads: int = None) -> IFFTBackend:
+    # threads=None lets the backend use its default, every core for the threaded ones
+    global _backend
+    if name not in FFT_BACKENDS:
+        raise ValueError(f"Unknown FFT backend '{name}', expected one of {list(FFT_BACKENDS)}")
+    _backend = FFT_BACKENDS[name]() if threads is None else FFT_BACKENDS[name](threads=threads)
+    return _backend
+
+
+def get_fft_backend() -> IFFTBackend:
+    # Picked from SIGNAL_EQUALIZER_FFT_BACKEND on first use, scipy by default
+    if _backend is None:
+        set_fft_backend(os.environ.get('SIGNAL_EQUALIZER_FFT_BACKEND', 'scipy'))
+    return _backend
+
+
+def rfft(x: np.ndarray, n: int = None, axis: int = 0) -> np.ndarray:
+    return get_fft_backend().rfft(x, n=n, axis=axis)
+
+
+def irfft(x: np.ndarray, n: int = None, axis: int = 0) -> np.ndarray:
+    return get_fft_backend().irfft(x, n=n, axis=axis)
+
+
+def fast_length(n: int) -> int:
+    # Smallest length >= n made of small prime factors, where the transforms are fastest
+    import scipy.fft
+    return scipy.fft.next_fast_len(n, real=True)
@@ -0,0 +1,117 @@
+import threading
+from dataclasses import dataclass
+
+from PyQt6.QtCore import QThread, pyqtSignal
+
+from helpers.load_signal_file import hash_signal_file, load_signal_file
+from managers.equalizer import Equalizer
+from managers.min_max_pyramid import MinMaxPyramid
+from managers.preview_equalizer import get_preview_equalizer
+from managers.profiler import PROFILER
+from managers.spectrogram import Spectrogram
+from models.equalizer_mode import ModeType, WindowType, get_mode_bands
+
+# Stages of an import in the order they finish. The waveform envelope comes right after decoding so a
+# preview shows up before the transforms run.
+IMPORT_STAGES = ('decode', 'decimate', 'transform', 'preview', 'spectrogram')
+
+
+@dataclass
+class ImportJob:
+    generation: int
+    file_path: str
+    mode: ModeType
+    window_type: WindowType
+
+
+@dataclass
+class ImportStage:
+    # data is (signal, file_name) for decode, then a MinMaxPyramid, an Equalizer, the preview Equalizer
+    # (None for short signals) and a Spectrogram. A failed stage carries the exception and ends the import.
+    generation: int
+    stage: str
+    data: object
+    error: Exception = None
+
+
+class ImportWorker(QThread):
+    """Loads a signal file off the GUI thread and posts every stage of the import as soon as it is done.
+
+    Submitting a file or cancelling drops the running import: its remaining stages are skipped at the
+    next stage boundary and anything it still posts carries a stale generation.
+    """
+
+    stage_ready = pyqtSignal(object)
+
+    def __init__(self, parent=None) -> None:
+        super().__init__(parent)
+        self._condition = threading.Condition()
+        self._job: ImportJob = None
+        self._generation = 0
+        self._running = True
+
+    def submit(self, file_path: str, mode: ModeType, window_type: WindowType) -> int:
+        with self._condition:
+            self._generation += 1
+            self._job = ImportJob(self._generation, file_path, mode, window_type)
+            self._condition.notify()
+            return self._generation
+
+    def cancel(self):
+        with self._condition:
+            self._generation += 1
+            self._job = None
+
+    def stop(self):
+        with self._condition:
+            self._running = False
+            self._condition.notify()
+        self.wait()
+
+    def is_stale(self, item) -> bool:
+        return item.generation != self._generation
+
+    def run(self):
+        while True:
+            with self._condition:
+                while self._running and self._job is None:
+                    self._condition.wait()
+                if not self._running:
+                    return
+                job = self._job
+                self._job = None
+            self._import(job)
+
+    def _import(self, job: ImportJob):
+        def transform():
+            # The file is hashed for the spectrum cache here rather than before decoding, so reading it
+            # twice doesn't delay the waveform
+            hash_signal_file(signal, job.file_path)
+            return Equalizer(signal, get_mode_bands(job.mode, signal.get_sampling_frequency() / 2, file_name), job.mode, job.window_type, incremental=True, pad_to_fast_length=True)
+
+        stages = {
+            'decode': lambda: load_signal_file(job.file_path, hash_content=False),
+            'decimate': lambda: MinMaxPyramid(signal),
+            'transform': transform,
+            'preview': lambda: get_preview_equalizer(equalizer),
+            'spectrogram': lambda: Spectrogram(signal),
+        }
+        for stage in IMPORT_STAGES:
+            if self.is_stale(job):
+                return
+            try:
+                with PROFILER.section(f'import.{stage}'):
+                    data = stages[stage]()
+            except Exception as error:
+                self.stage_ready.emit(ImportStage(job.generation, stage, None, error))
+                return
+            if stage == 'decode':
+                signal, file_name = data
+            elif stage == 'transform':
+                equalizer = data
+                # The spectrum plot is reduced here, so the GUI thread only draws a few thousand points
+                equalizer.get_display_envelope()
+            elif stage == 'spectrogram':
+                # Pooled here so the first slider preview doesn't pay for it
+                data.get_preview()
+            self.stage_ready.emit(ImportStage(job.generation, stage, data))
@@ -0,0 +1,56 @@
+import numpy as np
+
+from helpers.export_signal_file import export_signal_file
+from managers.block_equalizer import BlockEqualizer, get_window_std
+from models.equalizer_mode import WindowType
+from models.signal import Signal
+
+LONG_FILE_BLOCK_SIZE = 8192
+# Largest RMS difference to the whole-signal Equalizer's output at LONG_FILE_BLOCK_SIZE, relative to its
+# RMS, for any window type. Rectangle bands stay under 1%, the tapered ones reach about 3% on short clips.
+LONG_FILE_TOLERANCE = 0.04
+# Signals longer than this many frames are equalized block by block by the batch CLI
+LONG_FILE_THRESHOLD = 30 * 60 * 48000
+
+
+class LongFileEqualizer:
+    """Equalizes a signal block by block, so memory stays bounded by the block size instead of its length.
+
+    Blocks are read from the signal's (usually memory-mapped) samples and pushed through a BlockEqualizer,
+    whose sqrt-Hann overlap-add reconstructs the input exactly at unit gain. The gain curve is sampled at
+    the block resolution of sample_rate / (2 * block_size) Hz, so the output matches the whole-signal
+    Equalizer closely for smooth windows, with a little smearing at the edges of rectangle bands.
+    Larger blocks trade memory for a finer curve.
+    """
+
+    def __init__(self, signal: Signal, bands: list, window_type: WindowType = WindowType.RECTANGLE, block_size: int = LONG_FILE_BLOCK_SIZE) -> None:
+        self.signal = signal
+        self.block_size = block_size
+        sample_rate = signal.get_sampling_frequency()
+        window_std = get_window_std(signal.sample_count, sample_rate, 2 * block_size)
+        self.block_equalizer = BlockEqualizer(bands, sample_rate, window_type, block_size, signal.channels, window_std)
+
+    def set_gains(self, gains):
+        self.block_equalizer.gains[:] = gains
+
+    def iter_blocks(self):
+        """Yields (start, equalized block) pairs covering the signal in order, as float64 samples."""
+        self.block_equalizer.reset()
+        sample_count = self.signal.sample_count
+        block_shape = (self.block_size,) if self.signal.channels == 1 else (self.block_size, self.signal.channels)
+        block = np.zeros(block_shape)
+        # The equalizer delays its output by one block: the first output is dropped and a silent block
+        # pushed after the end flushes the last one
+        for start in range(0, sample_count + self.block_size, self.block_size):
+            samples = self.signal.y_vec[start:start + self.block_size]
+            block[:len(samples)] = samples
+            block[len(samples):] = 0
+            output = self.block_equalizer.process(block)
+            if start > 0:
+                output_start = start - self.block_size
+                yield output_start, output[:min(self.block_size, sample_count - output_start)]
+
+    def equalize_to_file(self, file_path: str, gains=None):
+        if gains is not None:
+            self.set_gains(gains)
+        export_signal_file(self.signal, file_path, self.iter_blocks())
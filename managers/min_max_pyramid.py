@@ -0,0 +1,68 @@
+import numpy as np
+
+from models.signal import Signal
+
+
+def get_min_max_envelope(x_vec: np.ndarray, y_vec: np.ndarray, width: int):
+    """Returns x and y of the min and max of y over width runs of values, for plotting long curves.
+
+    Curves of at most 2 * width values are returned as they are.
+    """
+    if len(y_vec) <= 2 * width:
+        return x_vec, y_vec
+    starts = np.arange(0, len(y_vec), -(-len(y_vec) // width))
+    envelope = np.empty(2 * len(starts), dtype=y_vec.dtype)
+    envelope[0::2] = np.minimum.reduceat(y_vec, starts)
+    envelope[1::2] = np.maximum.reduceat(y_vec, starts)
+    return np.repeat(x_vec[starts], 2), envelope
+
+
+class MinMaxPyramid:
+    """Multi-resolution min/max envelope of a signal, for plotting it at any zoom with a bounded point count.
+
+    Level k holds the min and max of every run of 2**k samples. Multi-channel signals are reduced to
+    their channel average first.
+    """
+
+    def __init__(self, signal: Signal) -> None:
+        self.signal = signal
+        self.y_vec = signal.get_mono()
+        self.mins = [self.y_vec]
+        self.maxs = [self.y_vec]
+        while len(self.mins[-1]) > 1:
+            self.mins.append(self._reduce(self.mins[-1], np.minimum))
+            self.maxs.append(self._reduce(self.maxs[-1], np.maximum))
+
+    @staticmethod
+    def _reduce(values: np.ndarray, function) -> np.ndarray:
+        # Pairs neighbours, an odd last value is kept alone
+        even = len(values) - len(values) % 2
+        reduced = function(values[0:even:2], values[1:even:2])
+        if even < len(values):
+            reduced = np.append(reduced, values[-1])
+        return reduced
+
+    @property
+    def y_range(self) -> tuple:
+        # Python floats, integer samples would overflow in the view box's max - min
+        return float(self.mins[-1][0]), float(self.maxs[-1][0])
+
+    def query(self, start_time: float, end_time: float, width: int):
+        """Returns x and y of the envelope between two times, with about 2 * width points."""
+        start = max(self.signal.index_at(start_time) - 1, 0)
+        stop = min(self.signal.index_at(end_time) + 1, len(self.y_vec))
+        if stop <= start:
+            return np.array([]), np.array([])
+
+        samples_per_pixel = (stop - start) / max(width, 1)
+        level = min(int(np.log2(samples_per_pixel)) if samples_per_pixel >= 2 else 0, len(self.mins) - 1)
+        if level == 0:
+            return self.signal.x_vec_slice(start, stop), self.y_vec[start:stop]
+
+        first, last = start >> level, ((stop - 1) >> level) + 1
+        indices = np.arange(first, last) << level
+        x_vec = np.repeat(self.signal.time_at(indices), 2)
+        y_vec = np.empty(2 * (last - first), dtype=self.mins[level].dtype)
+        y_vec[0::2] = self.mins[level][first:last]
+        y_vec[1::2] = self.maxs[level][first:last]
+        return x_vec, y_vec
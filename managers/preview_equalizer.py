@@ -0,0 +1,33 @@
+import math
+
+from managers.equalizer import Equalizer
+from models.signal import Signal
+
+# Previews are decimated to at most this many frames, so a slider drag costs about the same on a 10 s clip
+# as on an hour of audio. It is still a few times the points a plot can show.
+PREVIEW_SAMPLES = 2 ** 19
+
+
+def get_preview_factor(sample_count: int) -> int:
+    return max(1, math.ceil(sample_count / PREVIEW_SAMPLES))
+
+
+def decimate_signal(signal: Signal, factor: int) -> Signal:
+    # Channel average of the signal at 1 / factor of its rate. Polyphase resampling low-passes it before
+    # keeping every factor-th frame, so content above the new Nyquist frequency is removed instead of
+    # aliasing into the preview.
+    from scipy.signal import resample_poly
+    y_vec = resample_poly(signal.get_mono(), 1, factor)
+    return Signal(None, y_vec, sample_rate=signal.get_sampling_frequency() / factor, start_time=signal.start_time)
+
+
+def get_preview_equalizer(equalizer: Equalizer) -> Equalizer:
+    """Equalizer over a decimated, channel-averaged copy of the equalizer's signal, with the same bands.
+
+    Returns None for signals short enough to equalize at full rate interactively. Bands above the
+    preview's Nyquist frequency have no bins, they only show up in the full-rate output.
+    """
+    factor = get_preview_factor(len(equalizer.y_vec))
+    if factor == 1:
+        return None
+    return Equalizer(decimate_signal(equalizer.signal, factor), equalizer.bands, equalizer.mode, equalizer.window_type, incremental=True, pad_to_fast_length=True, dtype=equalizer.dtype)
@@ -0,0 +1,148 @@
+import functools
+import json
+import os
+import sys
+import threading
+import time
+from collections import deque
+
+import numpy as np
+
+try:
+    import resource
+except ImportError:
+    resource = None
+
+# Latencies kept per section for the rolling statistics, and trace events kept for the dump
+PROFILER_WINDOW = 500
+PROFILER_MAX_EVENTS = 100000
+# Upper edges in milliseconds of the latency histogram buckets, the last bucket is open-ended
+LATENCY_BUCKETS_MS = (1, 2, 5, 10, 20, 50, 100, 200, 500, 1000)
+
+
+def get_peak_rss() -> int:
+    # Peak resident memory of the process in bytes, 0 where the platform doesn't report it
+    if resource is None:
+        return 0
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux reports kilobytes, macOS bytes
+    return peak if sys.platform == 'darwin' else peak * 1024
+
+
+class Profiler:
+    """Records the latency of named code sections, for the status-bar overlay and trace dumps.
+
+    Every section keeps its last PROFILER_WINDOW latencies and how much it raised the process's peak
+    memory. Completed sections are also kept as Chrome trace events, viewable in chrome://tracing or
+    Perfetto. Recording is thread-safe, so sections run by the recompute worker show up on their own track.
+    """
+
+    def __init__(self, enabled: bool = True) -> None:
+        self.enabled = enabled
+        self.latencies = {}
+        self.peak_memory_growth = {}
+        self.events = deque(maxlen=PROFILER_MAX_EVENTS)
+        self.origin = time.perf_counter()
+        self.lock = threading.Lock()
+
+    def section(self, name: str):
+        return _Section(self, name) if self.enabled else _NULL_SECTION
+
+    def profiled(self, name: str = None):
+        # Decorator timing every call of a function as one section
+        def decorator(function):
+            section_name = name or function.__qualname__
+
+            @functools.wraps(function)
+            def wrapper(*args, **kwargs):
+                with self.section(section_name):
+                    return function(*args, **kwargs)
+            return wrapper
+        return decorator
+
+    def record(self, name: str, start: float, end: float, peak_memory_growth: int):
+        with self.lock:
+            if name not in self.latencies:
+                self.latencies[name] = deque(maxlen=PROFILER_WINDOW)
+                self.peak_memory_growth[name] = 0
+            self.latencies[name].append(end - start)
+            self.peak_memory_growth[name] = max(self.peak_memory_growth[name], peak_memory_growth)
+            self.events.append({
+                'name': name,
+                'ph': 'X',
+                'ts': (start - self.origin) * 1e6,
+                'dur': (end - start) * 1e6,
+                'pid': os.getpid(),
+                'tid': threading.get_ident(),
+            })
+
+    def reset(self):
+        with self.lock:
+            self.latencies.clear()
+            self.peak_memory_growth.clear()
+            self.events.clear()
+
+    def get_stats(self) -> dict:
+        """Latency percentiles and histogram in milliseconds, and peak memory growth in bytes, by section."""
+        with self.lock:
+            latencies = {name: np.array(values) * 1000 for name, values in self.latencies.items()}
+            peak_memory_growth = dict(self.peak_memory_growth)
+        stats = {}
+        for name, values in latencies.items():
+            stats[name] = {
+                'count': len(values),
+                'p50_ms': float(np.percentile(values, 50)),
+                'p95_ms': float(np.percentile(values, 95)),
+                'max_ms': float(values.max()),
+                'histogram': {
+                    'buckets_ms': list(LATENCY_BUCKETS_MS),
+                    'counts': np.bincount(np.searchsorted(LATENCY_BUCKETS_MS, values), minlength=len(LATENCY_BUCKETS_MS) + 1).tolist(),
+                },
+                'peak_memory_growth': peak_memory_growth[name],
+            }
+        return stats
+
+    def dump(self, file_path: str):
+        # Chrome trace format, the rolling statistics and peak memory are stored next to the events
+        with self.lock:
+            events = list(self.events)
+        trace = {
+            'traceEvents': events,
+            'displayTimeUnit': 'ms',
+            'otherData': {'stats': self.get_stats(), 'peak_rss': get_peak_rss()},
+        }
+        with open(file_path, 'w') as trace_file:
+            json.dump(trace, trace_file)
+
+
+class _Section:
+    __slots__ = ('profiler', 'name', 'start', 'peak_rss')
+
+    def __init__(self, profiler: Profiler, name: str) -> None:
+        self.profiler = profiler
+        self.name = name
+
+    def __enter__(self):
+        self.peak_rss = get_peak_rss()
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc_info):
+        end = time.perf_counter()
+        self.profiler.record(self.name, self.start, end, get_peak_rss() - self.peak_rss)
+        return False
+
+
+class _NullSection:
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        return False
+
+
+_NULL_SECTION = _NullSection()
+
+# Shared by the GUI and the engine, set SIGNAL_EQUALIZER_PROFILE=0 to turn recording off
+PROFILER = Profiler(enabled=os.environ.get('SIGNAL_EQUALIZER_PROFILE', '1') != '0')
+profiled = PROFILER.profiled
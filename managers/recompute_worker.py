@@ -0,0 +1,127 @@
+import threading
+from dataclasses import dataclass
+
+import numpy as np
+from PyQt6.QtCore import QThread, pyqtSignal
+
+from managers.equalizer import Equalizer
+from managers.min_max_pyramid import MinMaxPyramid
+from managers.profiler import PROFILER, profiled
+from managers.spectrogram import Spectrogram
+from models.equalizer_mode import WindowType
+from models.signal import Signal
+
+
+@dataclass
+class RecomputeJob:
+    generation: int
+    window_type: WindowType
+    gains: list
+
+
+@dataclass
+class RecomputeResult:
+    # Preview results are equalized from the decimated signal, the full-rate result of the same job follows.
+    # frequencies and window_plot are the gain curve's display envelope.
+    generation: int
+    frequencies: np.ndarray
+    window_plot: np.ndarray
+    output: Signal
+    pyramid: MinMaxPyramid
+    spectrogram: np.ndarray
+    preview: bool = False
+
+
+class RecomputeWorker(QThread):
+    """Applies slider and window changes to the equalizer off the GUI thread.
+
+    Only the latest submitted job is kept: jobs arriving while one is running replace the pending one,
+    and a running job gives up as soon as a newer one is submitted, so only the final state is posted.
+    With a preview equalizer, every job first posts the output of the decimated signal, then refines it
+    to full rate, so a slider drag only waits for the preview.
+    """
+
+    result_ready = pyqtSignal(object)
+
+    def __init__(self, parent=None) -> None:
+        super().__init__(parent)
+        self._condition = threading.Condition()
+        self._equalizer: Equalizer = None
+        self._spectrogram: Spectrogram = None
+        self._preview: Equalizer = None
+        self._job: RecomputeJob = None
+        self._generation = 0
+        self._running = True
+
+    def set_equalizer(self, equalizer: Equalizer, spectrogram: Spectrogram = None, preview: Equalizer = None):
+        with self._condition:
+            self._equalizer = equalizer
+            self._spectrogram = spectrogram
+            self._preview = preview
+            self._job = None
+            self._generation += 1
+
+    def submit(self, window_type: WindowType, gains: list):
+        with self._condition:
+            self._generation += 1
+            self._job = RecomputeJob(self._generation, window_type, list(gains))
+            self._condition.notify()
+
+    def stop(self):
+        with self._condition:
+            self._running = False
+            self._condition.notify()
+        self.wait()
+
+    def is_stale(self, job: RecomputeJob) -> bool:
+        return job.generation != self._generation
+
+    def run(self):
+        while True:
+            with self._condition:
+                while self._running and self._job is None:
+                    self._condition.wait()
+                if not self._running:
+                    return
+                job, equalizer, spectrogram, preview = self._job, self._equalizer, self._spectrogram, self._preview
+                self._job = None
+            if equalizer is None:
+                continue
+            self._recompute(equalizer, spectrogram, preview, job)
+
+    @profiled('recompute')
+    def _recompute(self, equalizer: Equalizer, spectrogram: Spectrogram, preview: Equalizer, job: RecomputeJob):
+        if preview is not None:
+            with PROFILER.section('preview'):
+                result = self._equalize(preview, spectrogram, job, preview=True)
+            if result is None:
+                return
+            self.result_ready.emit(result)
+        result = self._equalize(equalizer, spectrogram, job)
+        if result is not None:
+            self.result_ready.emit(result)
+
+    def _equalize(self, equalizer: Equalizer, spectrogram: Spectrogram, job: RecomputeJob, preview: bool = False):
+        equalizer.set_window_type(job.window_type)
+        for index, gain in enumerate(job.gains):
+            if self.is_stale(job):
+                return None
+            equalizer.set_gain(index, gain)
+        window_plot = equalizer.window_plot.copy()
+
+        with PROFILER.section('synthesize.preview' if preview else 'synthesize'):
+            output = equalizer.generate_output_signal()
+        if self.is_stale(job):
+            return None
+        pyramid = MinMaxPyramid(output)
+
+        # The output spectrogram is the cached input one weighted by the gain curve. Previews weight a
+        # low-resolution copy of it, the full-resolution image would cost as much as the full-rate output.
+        spectrogram_image = None
+        if spectrogram is not None:
+            if preview:
+                spectrogram = spectrogram.get_preview()
+            spectrogram_image = spectrogram.get_image(spectrogram.resample_gain(equalizer.frequencies, window_plot))
+        if self.is_stale(job):
+            return None
+        return RecomputeResult(job.generation, *equalizer.get_display_window_plot(), output, pyramid, spectrogram_image, preview)
@@ -0,0 +1,77 @@
+from abc import ABC, abstractmethod
+import wave
+
+import numpy as np
+
+from models.signal import Signal
+
+EXPORT_CHUNK_SIZE = 65536
+
+
+def iter_signal_chunks(signal: Signal, chunk_size: int = EXPORT_CHUNK_SIZE):
+    # (start, samples) views of the signal's buffer, nothing is copied
+    for start in range(0, signal.sample_count, chunk_size):
+        yield start, signal.y_vec[start:start + chunk_size]
+
+
+def to_pcm(chunk: np.ndarray, full_scale: float, dtype=np.int16) -> np.ndarray:
+    # Maps [-full_scale, full_scale) onto the integer range, rounding and clipping instead of wrapping.
+    # Integer input at the output's width is passed through unchanged.
+    info = np.iinfo(dtype)
+    scaled = np.multiply(chunk, (info.max + 1) / full_scale, dtype=np.float64)
+    np.rint(scaled, out=scaled)
+    np.clip(scaled, info.min, info.max, out=scaled)
+    return scaled.astype(dtype)
+
+
+# Interface that describes how signal exporters should be implemented
+class ISignalExporter(ABC):
+    @abstractmethod
+    def export(self, signal: Signal, file_path: str, chunks=None):
+        """Writes chunks, (start, samples) pairs in order, or the whole signal when they are None.
+
+        signal provides the sample rate, channels, scale and time axis of the chunks.
+        """
+        pass
+
+
+class WavSignalExporter(ISignalExporter):
+    # sample_width None follows the signal: 8 and 16-bit audio is written as 16-bit, 24-bit, 32-bit and
+    # float audio as 32-bit, so no precision is lost. Signals that aren't audio are written as 16-bit.
+    def __init__(self, sample_width: int = None) -> None:
+        self.sample_width = sample_width
+
+    def export(self, signal: Signal, file_path: str, chunks=None):
+        full_scale = signal.full_scale or 1.0
+        sample_width = self.sample_width or (4 if signal.audio is not None and signal.audio.sample_width > 2 else 2)
+        dtype = {2: np.int16, 4: np.int32}[sample_width]
+        with wave.open(file_path, 'wb') as wav_file:
+            wav_file.setnchannels(signal.channels)
+            wav_file.setsampwidth(sample_width)
+            wav_file.setframerate(int(signal.get_sampling_frequency()))
+            for _, chunk in chunks or iter_signal_chunks(signal):
+                # wave takes any buffer, the frames are written straight from the array
+                wav_file.writeframes(to_pcm(chunk, full_scale, dtype))
+
+
+class FlacSignalExporter(ISignalExporter):
+    def export(self, signal: Signal, file_path: str, chunks=None):
+        # soundfile loads libsndfile, which is put off until a FLAC file is exported
+        try:
+            import soundfile
+        except ImportError:
+            raise ImportError('FLAC export needs the soundfile package')
+        full_scale = signal.full_scale or 1.0
+        with soundfile.SoundFile(file_path, 'w', int(signal.get_sampling_frequency()), signal.channels, 'PCM_16', format='FLAC') as flac_file:
+            for _, chunk in chunks or iter_signal_chunks(signal):
+                flac_file.write(to_pcm(chunk, full_scale))
+
+
+class CSVSignalExporter(ISignalExporter):
+    # Time/amplitude columns with a header row, which is the layout CSVSignalLoader reads back
+    def export(self, signal: Signal, file_path: str, chunks=None):
+        with open(file_path, 'w') as csv_file:
+            csv_file.write('time,amplitude\n')
+            for start, chunk in chunks or iter_signal_chunks(signal):
+                x_vec = signal.x_vec_slice(start, start + len(chunk))
+                np.savetxt(csv_file, np.column_stack((x_vec, chunk)), delimiter=',')
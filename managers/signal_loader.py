@@ -1,8 +1,20 @@
+import csv
 from abc import ABC, abstractmethod
-import pandas as pd
-from models.signal import Signal
-from pydub import AudioSegment
+from models.signal import Signal, AudioInfo
 import numpy as np
+from helpers.signal_cache import load_cached_signal, save_cached_signal
+
+# pandas, pydub, scipy.io and pyarrow are imported by the loaders that use them, on their first load,
+# so none of them is paid for at startup
+
+
+def get_pyarrow():
+    try:
+        import pyarrow
+        import pyarrow.csv
+    except ImportError:
+        return None
+    return pyarrow
 
 # Interface that describes how signal loaders should be implemented
 class ISignalLoader(ABC):
@@ -11,44 +23,90 @@ class ISignalLoader(ABC):
         pass
 
 
-class TextSignalLoader(ISignalLoader):
-    def load(self, file_path: str) -> Signal:
-        data = pd.read_csv(file_path)
-        x = data.iloc[:, 0].values
-        y = data.iloc[:, 1].values
-        return Signal(x, y)
-    
-class CSVSignalLoader(ISignalLoader):
+class DelimitedSignalLoader(ISignalLoader):
+    # Comma separated time/amplitude columns with a header row, parsed as float64 without type inference.
+    # The parsed signal is cached by path, size and mtime, so reopening the file only maps the cache.
+    def __init__(self, use_cache: bool = True) -> None:
+        self.use_cache = use_cache
+
     def load(self, file_path: str) -> Signal:
-        data = pd.read_csv(file_path)
-        x = data.iloc[:, 0].values
-        y = data.iloc[:, 1].values
-        return Signal(x, y)
+        if self.use_cache:
+            signal = load_cached_signal(file_path)
+            if signal is not None:
+                return signal
+        x, y = self.parse(file_path)
+        signal = Signal.from_samples(x, y)
+        if self.use_cache:
+            save_cached_signal(file_path, signal)
+        return signal
+
+    def parse(self, file_path: str):
+        pyarrow = get_pyarrow()
+        with open(file_path, newline='') as csv_file:
+            columns = next(csv.reader(csv_file), [])[:2]
+        if pyarrow is not None and len(set(columns)) == 2:
+            # Only the first two columns are read, straight into float64 without inferring their types
+            convert_options = pyarrow.csv.ConvertOptions(column_types={column: pyarrow.float64() for column in columns}, include_columns=columns)
+            table = pyarrow.csv.read_csv(file_path, convert_options=convert_options)
+            return table.column(0).to_numpy(), table.column(1).to_numpy()
+        data = np.loadtxt(file_path, delimiter=',', skiprows=1, usecols=(0, 1), dtype=np.float64, ndmin=2)
+        return data[:, 0], data[:, 1]
+
+
+class TextSignalLoader(DelimitedSignalLoader):
+    pass
+
+class CSVSignalLoader(DelimitedSignalLoader):
+    pass
 
 class ExcelXSignalLoader(ISignalLoader):
     def load(self, file_path: str) -> Signal:
+        import pandas as pd
         data = pd.read_excel(file_path)
         x = data.iloc[:, 0].values
         y = data.iloc[:, 1].values
-        return Signal(x, y)
+        return Signal.from_samples(x, y)
     
 class ExcelSignalLoader(ISignalLoader):
     def load(self, file_path: str) -> Signal:
+        import pandas as pd
         data = pd.read_excel(file_path)
         x = data.iloc[:, 0].values
         y = data.iloc[:, 1].values
-        return Signal(x, y)
+        return Signal.from_samples(x, y)
     
 class Mp3SignalLoader(ISignalLoader):
     def load(self, file_path: str) -> Signal:
+        from pydub import AudioSegment
         audio = AudioSegment.from_mp3(file_path)
         audio_data = np.array(audio.get_array_of_samples())
-        time = np.arange(0, len(audio_data)) / (audio.frame_rate * 2)
-        return Signal(time, audio_data, audio)    
+        if audio.channels > 1:
+            # get_array_of_samples() interleaves the channels, one row per frame
+            audio_data = audio_data.reshape(-1, audio.channels)
+        return Signal(None, audio_data, audio, sample_rate=audio.frame_rate)
     
 class WavSignalLoader(ISignalLoader):
     def load(self, file_path: str) -> Signal:
+        # Samples are memory-mapped straight from the file and the time axis is only built when needed
+        from scipy.io import wavfile
+        try:
+            frame_rate, data = wavfile.read(file_path, mmap=True)
+        except ValueError:
+            # formats numpy can't map directly (e.g. 24-bit PCM) go through pydub
+            return PydubWavSignalLoader().load(file_path)
+        if data.dtype == np.uint8:
+            # 8-bit WAV is unsigned and centred on 128, shifted to signed samples centred on 0 like pydub's
+            data = (data.astype(np.int16) - 128).astype(np.int8)
+        channels = 1 if data.ndim == 1 else data.shape[1]
+        audio = AudioInfo(frame_rate, data.dtype.itemsize, channels, data.dtype.kind == 'f')
+        return Signal(None, data, audio, sample_rate=frame_rate)
+
+class PydubWavSignalLoader(ISignalLoader):
+    def load(self, file_path: str) -> Signal:
+        from pydub import AudioSegment
         audio = AudioSegment.from_wav(file_path)
         audio_data = np.array(audio.get_array_of_samples())
-        time = np.arange(0, len(audio_data)) / (audio.frame_rate * 2)
-        return Signal(time, audio_data, audio)    
\ No newline at end of file
+        if audio.channels > 1:
+            # get_array_of_samples() interleaves the channels, one row per frame
+            audio_data = audio_data.reshape(-1, audio.channels)
+        return Signal(None, audio_data, audio, sample_rate=audio.frame_rate)
@@ -0,0 +1,78 @@
+import copy
+
+import numpy as np
+from numpy.lib.stride_tricks import sliding_window_view
+
+from managers import fft_backend
+from models.signal import Signal
+
+# Same framing as matplotlib's specgram defaults
+SPECTROGRAM_NFFT = 256
+SPECTROGRAM_OVERLAP = 128
+# Floor of the power before taking its log, silent frames would otherwise give -inf
+MIN_POWER = 1e-20
+# Frames windowed and transformed at once, so the temporaries stay at a few MB for any signal length
+SPECTROGRAM_CHUNK_FRAMES = 4096
+# Preview images pool the frames down to about this many columns, a few times a plot's width
+SPECTROGRAM_PREVIEW_FRAMES = 2048
+
+
+class Spectrogram:
+    """Short-time power spectrum of a signal, computed once and reused for its equalized versions.
+
+    Equalizing multiplies the spectrum by a gain curve, so the output spectrogram is approximated by the
+    cached input power times the squared gain at each bin, without going back to the time domain.
+    """
+
+    def __init__(self, signal: Signal, nfft: int = SPECTROGRAM_NFFT, noverlap: int = SPECTROGRAM_OVERLAP) -> None:
+        sample_rate = signal.get_sampling_frequency()
+        y_vec = signal.get_mono()
+        if len(y_vec) < nfft:
+            y_vec = np.pad(y_vec, (0, nfft - len(y_vec)))
+        hop = nfft - noverlap
+        # Strided view of every frame, only one chunk of them is windowed and transformed at a time.
+        # Single precision is plenty for a dB image and halves the cached power.
+        frames = sliding_window_view(y_vec, nfft)[::hop]
+        window = np.hanning(nfft)
+        self.power = np.empty((len(frames), nfft // 2 + 1), dtype=np.float32)
+        for start in range(0, len(frames), SPECTROGRAM_CHUNK_FRAMES):
+            stft = fft_backend.rfft(frames[start:start + SPECTROGRAM_CHUNK_FRAMES] * window, axis=1)
+            np.square(np.abs(stft), out=self.power[start:start + SPECTROGRAM_CHUNK_FRAMES], casting='same_kind')
+        self.frequencies = np.fft.rfftfreq(nfft, d=1 / sample_rate)
+        self._preview: Spectrogram = None
+        self.times = signal.start_time + (np.arange(len(frames)) * hop + nfft / 2) / sample_rate
+        self.rect = (
+            self.times[0] - hop / (2 * sample_rate),
+            0.0,
+            len(frames) * hop / sample_rate,
+            self.frequencies[-1],
+        )
+
+    def get_preview(self, max_frames: int = SPECTROGRAM_PREVIEW_FRAMES):
+        """Same spectrogram with runs of frames averaged into one, so its images cost the same at any length.
+
+        It covers the same rect and bins. It is built on first use and kept.
+        """
+        if len(self.power) <= max_frames:
+            return self
+        if self._preview is None:
+            factor = -(-len(self.power) // max_frames)
+            starts = np.arange(0, len(self.power), factor)
+            counts = np.diff(np.append(starts, len(self.power)))
+            preview = copy.copy(self)
+            preview.power = np.add.reduceat(self.power, starts, axis=0) / counts[:, np.newaxis].astype(self.power.dtype)
+            preview.times = np.add.reduceat(self.times, starts) / counts
+            self._preview = preview
+        return self._preview
+
+    def get_image(self, gain_curve: np.ndarray = None) -> np.ndarray:
+        # (frames, bins) image in dB
+        image = self.power * np.square(gain_curve).astype(self.power.dtype) if gain_curve is not None else self.power.copy()
+        np.maximum(image, MIN_POWER, out=image)
+        np.log10(image, out=image)
+        image *= 10
+        return image
+
+    def resample_gain(self, frequencies: np.ndarray, gain_curve: np.ndarray) -> np.ndarray:
+        # The equalizer's gain curve is sampled at its own, finer, frequency resolution
+        return np.interp(self.frequencies, frequencies, gain_curve)
@@ -0,0 +1,165 @@
+import threading
+import time
+import wave
+
+import numpy as np
+
+from managers.block_equalizer import STREAM_BLOCK_SIZE, BlockEqualizer
+from models.signal import Signal
+
+
+def get_sounddevice():
+    # sounddevice loads PortAudio when it is imported, which is put off until something is played
+    import sounddevice
+    return sounddevice
+
+
+class CallbackStop(Exception):
+    # Ends playback on streams other than sounddevice's, which have their own CallbackStop
+    pass
+
+
+class NullOutputStream:
+    """Stand-in for sounddevice.OutputStream that pulls blocks from the callback on a plain thread.
+
+    Blocks are dropped, or written to a 16-bit wav file when file_path is given. Unless realtime is set,
+    blocks are pulled as fast as the callback produces them, which makes it usable without an audio device.
+    """
+
+    def __init__(self, samplerate, blocksize, channels, dtype, callback, finished_callback=None, file_path: str = None, realtime: bool = False) -> None:
+        self.samplerate = samplerate
+        self.blocksize = blocksize
+        self.channels = channels
+        self.dtype = dtype
+        self.callback = callback
+        self.finished_callback = finished_callback
+        self.file_path = file_path
+        self.realtime = realtime
+        self.frames_played = 0
+        self.active = False
+        self._thread = None
+
+    @property
+    def time(self) -> float:
+        return self.frames_played / self.samplerate
+
+    def start(self):
+        self.active = True
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        self.active = False
+        if self._thread is not None and self._thread is not threading.current_thread():
+            self._thread.join()
+
+    def close(self):
+        self.stop()
+
+    def _run(self):
+        wav_file = None
+        if self.file_path:
+            wav_file = wave.open(self.file_path, 'wb')
+            wav_file.setnchannels(self.channels)
+            wav_file.setsampwidth(2)
+            wav_file.setframerate(int(self.samplerate))
+        outdata = np.zeros((self.blocksize, self.channels), dtype=self.dtype)
+        try:
+            while self.active:
+                try:
+                    self.callback(outdata, self.blocksize, None, None)
+                except CallbackStop:
+                    self.active = False
+                if wav_file:
+                    wav_file.writeframes((np.clip(outdata, -1, 1) * 32767).astype(np.int16).tobytes())
+                self.frames_played += self.blocksize
+                if self.realtime:
+                    time.sleep(self.blocksize / self.samplerate)
+        finally:
+            if wav_file:
+                wav_file.close()
+            self.active = False
+            if self.finished_callback:
+                self.finished_callback()
+
+
+class StreamPlayer:
+    """Plays a signal block by block through an output stream, equalizing each block on the fly."""
+
+    def __init__(self, signal: Signal, block_equalizer: BlockEqualizer = None, stream_factory=None, block_size: int = STREAM_BLOCK_SIZE) -> None:
+        # stream_factory defaults to sounddevice.OutputStream, other factories are stopped with CallbackStop
+        self.signal = signal
+        self.block_equalizer = block_equalizer
+        self.stream_factory = stream_factory
+        self.block_size = block_equalizer.block_size if block_equalizer else block_size
+        self.sample_rate = signal.audio.frame_rate
+        self.channels = signal.channels
+        self.scale = signal.full_scale
+        self.position = 0
+        # The equalizer delays its output by one block, so playback runs one extra block past the end
+        self.end_position = len(signal.y_vec) + (self.block_size if block_equalizer else 0)
+        self.stream = None
+        self.stop_exception = CallbackStop
+        # Frame a running stream jumps to at its next block, see seek
+        self._seek_position = None
+        self._seek_lock = threading.Lock()
+
+    @property
+    def current_time(self) -> float:
+        # Sample being heard: the callback position minus the equalizer's block and the device's output
+        # latency, on the signal's own time axis so it lines up with the plots and sliders
+        heard = self.position - (self.block_size if self.block_equalizer else 0)
+        if self.stream is not None:
+            heard -= int(getattr(self.stream, 'latency', 0) * self.sample_rate)
+        return self.signal.time_at(min(max(heard, 0), self.signal.sample_count - 1))
+
+    @property
+    def is_active(self) -> bool:
+        return self.stream is not None and self.stream.active
+
+    def start(self, start_time: float = 0):
+        self.stop()
+        self.position = self.signal.index_at(start_time)
+        self._seek_position = None
+        if self.block_equalizer:
+            self.block_equalizer.reset()
+        stream_factory = self.stream_factory
+        if stream_factory is None:
+            sounddevice = get_sounddevice()
+            stream_factory, self.stop_exception = sounddevice.OutputStream, sounddevice.CallbackStop
+        self.stream = stream_factory(
+            samplerate=self.sample_rate,
+            blocksize=self.block_size,
+            channels=self.channels,
+            dtype='float32',
+            callback=self._callback,
+        )
+        self.stream.start()
+
+    def seek(self, time: float):
+        # Moves a running stream without reopening it, the callback applies it at its next block
+        with self._seek_lock:
+            self._seek_position = self.signal.index_at(time)
+
+    def stop(self):
+        if self.stream is not None:
+            self.stream.stop()
+            self.stream.close()
+            self.stream = None
+
+    def _callback(self, outdata, frames, time_info, status):
+        with self._seek_lock:
+            seek_position, self._seek_position = self._seek_position, None
+        if seek_position is not None:
+            self.position = seek_position
+            if self.block_equalizer:
+                self.block_equalizer.reset()
+        block = np.zeros((frames,) if self.channels == 1 else (frames, self.channels))
+        samples = self.signal.y_vec[self.position:self.position + frames]
+        block[:len(samples)] = samples / self.scale
+        if self.block_equalizer:
+            block = self.block_equalizer.process(block)
+        outdata[:] = block.reshape(frames, self.channels)
+        self.position += frames
+        if self.position >= self.end_position:
+            raise self.stop_exception
@@ -0,0 +1,74 @@
+from enum import Enum
+
+
+class WindowType(Enum):
+    RECTANGLE = 'rectangle'
+    HAMMING = 'hamming'
+    HANNING = 'hanning'
+    GAUSSIAN = 'gaussian'
+
+
+class ModeType(Enum):
+    ANIMALS = 'animals'
+    MUSIC = 'music'
+    UNIFORM = 'uniform'
+    ECG = 'ecg'
+
+
+UNIFORM_BANDS_COUNT = 10
+
+# Frequency bands (in Hz) and slider labels of every mode
+MODE_BANDS = {
+    ModeType.ANIMALS: [
+        [0, 450],
+        [450, 1100],
+        [1100, 3000],
+        [3000, 9000],
+    ],
+    ModeType.MUSIC: [
+        [0, 200],
+        [200, 500],
+        [400, 800],
+        [800, 2200],
+    ],
+}
+
+MODE_LABELS = {
+    ModeType.ANIMALS: ['Dogs', 'Wolves', 'Crow', 'Bat'],
+    ModeType.MUSIC: ['Kalimba', 'Guitar', 'Violin', 'Piccolo'],
+    ModeType.ECG: ['Abnormality 1', 'Abnormality 2', 'Abnormality 3', 'Normal'],
+    ModeType.UNIFORM: [f'Range {i + 1}' for i in range(UNIFORM_BANDS_COUNT)],
+}
+
+# ECG bands depend on which abnormality the recording is named after
+ABNORMALITIES_BANDS = {
+    'Abnormality 1': [
+        [0, 5],
+        [5, 7],
+        [7, 9],
+        [120, 180],
+    ],
+    'Abnormality 2': [
+        [0, 1],
+        [1, 10],
+        [12, 14],
+        [120, 180],
+    ],
+    'Abnormality 3': [
+        [0, 1],
+        [1, 3],
+        [3, 12],
+        [120, 180],
+    ],
+}
+
+
+def get_mode_bands(mode: ModeType, max_frequency: float, file_name: str = None) -> list:
+    if mode == ModeType.UNIFORM:
+        band_width = max_frequency / UNIFORM_BANDS_COUNT
+        return [[i * band_width, (i + 1) * band_width] for i in range(UNIFORM_BANDS_COUNT)]
+    if mode == ModeType.ECG:
+        if file_name not in ABNORMALITIES_BANDS:
+            raise ValueError(f"No ECG band table for '{file_name}', expected one of {list(ABNORMALITIES_BANDS)}")
+        return ABNORMALITIES_BANDS[file_name]
+    return MODE_BANDS[mode]
@@ -0,0 +1,46 @@
+import json
+from dataclasses import dataclass
+
+from models.equalizer_mode import ModeType, WindowType, MODE_LABELS, ABNORMALITIES_BANDS, get_mode_bands
+
+
+@dataclass
+class EqualizerPreset:
+    # Mode, window and slider gains applied to many files at once. ECG band tables are normally picked
+    # by file name, band_table names one of them to use for every file instead.
+    mode: ModeType
+    window_type: WindowType
+    gains: list
+    band_table: str = None
+
+    def __post_init__(self):
+        bands_count = len(MODE_LABELS[self.mode])
+        if len(self.gains) != bands_count:
+            raise ValueError(f'{self.mode.value} mode expects {bands_count} gains, got {len(self.gains)}')
+        if self.band_table is not None and self.mode != ModeType.ECG:
+            raise ValueError('band_table only applies to the ecg mode')
+        if self.band_table is not None and self.band_table not in ABNORMALITIES_BANDS:
+            raise ValueError(f"No ECG band table '{self.band_table}', expected one of {list(ABNORMALITIES_BANDS)}")
+
+    def get_bands(self, max_frequency: float, file_name: str = None) -> list:
+        if self.band_table is not None:
+            return ABNORMALITIES_BANDS[self.band_table]
+        return get_mode_bands(self.mode, max_frequency, file_name)
+
+    @classmethod
+    def from_dict(cls, data: dict):
+        mode = ModeType(data['mode'])
+        gains = data.get('gains', [1.0] * len(MODE_LABELS[mode]))
+        return cls(mode, WindowType(data.get('window', WindowType.RECTANGLE.value)), [float(gain) for gain in gains], data.get('band_table'))
+
+    def to_dict(self) -> dict:
+        data = {'mode': self.mode.value, 'window': self.window_type.value, 'gains': self.gains}
+        if self.band_table is not None:
+            data['band_table'] = self.band_table
+        return data
+
+
+def load_preset(file_path: str) -> EqualizerPreset:
+    # JSON object with "mode", and optionally "window", "gains" and "band_table"
+    with open(file_path) as preset_file:
+        return EqualizerPreset.from_dict(json.load(preset_file))
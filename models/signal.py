@@ -1,3 +1,4 @@
+from dataclasses import dataclass
 from enum import Enum
 import numpy as np
 
@@ -6,23 +7,119 @@ class SignalType(Enum):
     DISCRETE = 1
 
 
+@dataclass
+class AudioInfo:
+    # Format of an audio file whose samples were read without decoding it into an AudioSegment
+    frame_rate: int
+    sample_width: int
+    channels: int
+    is_float: bool = False
+
+
 class Signal:
-    def __init__(self, x_vec, y_vec,audio=None, signal_type: SignalType = SignalType.CONTINUOUS, is_playing = False, current_index = 0, current_time = 0) -> None:
-        self.x_vec = x_vec
+    # Uniformly sampled signals don't store their time axis: with x_vec=None it is described by
+    # start_time and sample_rate, and x_vec is computed on access. y_vec keeps the loader's dtype,
+    # and is (n_frames,) for mono or (n_frames, n_channels) for multi-channel signals.
+    # content_key is the hash of the file the samples were loaded from, None for computed signals.
+    __slots__ = ('_x_vec', '_start_time', 'sample_rate', 'y_vec', 'audio', 'signal_type', 'is_playing', 'current_index', 'current_time', 'content_key')
+
+    def __init__(self, x_vec, y_vec,audio=None, signal_type: SignalType = SignalType.CONTINUOUS, is_playing = False, current_index = 0, current_time = 0, sample_rate = None, start_time = 0.0, content_key = None) -> None:
+        self._x_vec = x_vec
+        self._start_time = start_time
+        self.sample_rate = sample_rate
         self.y_vec = y_vec
         self.audio = audio
         self.signal_type = signal_type
         self.is_playing = is_playing
         self.current_index = current_index
         self.current_time = current_time
+        self.content_key = content_key
+
+    @classmethod
+    def from_samples(cls, x_vec, y_vec, audio=None):
+        # Drop x_vec when it is evenly spaced, so only its start and rate are kept
+        if len(x_vec) > 1:
+            time_difference = (x_vec[-1] - x_vec[0]) / (len(x_vec) - 1)
+            if time_difference > 0 and np.allclose(np.diff(x_vec), time_difference, rtol=1e-6, atol=0):
+                sample_rate = 1 / time_difference
+                if np.isclose(sample_rate, round(sample_rate), rtol=1e-9, atol=0):
+                    sample_rate = float(round(sample_rate))
+                return cls(None, y_vec, audio, sample_rate=sample_rate, start_time=float(x_vec[0]))
+        return cls(x_vec, y_vec, audio)
+
+    def derive(self, y_vec, audio=None):
+        # New signal on the same time axis, e.g. the equalized output of this one
+        return Signal(self._x_vec, y_vec, audio, sample_rate=self.sample_rate, start_time=self._start_time)
+
+    @property
+    def is_uniform(self) -> bool:
+        return self._x_vec is None
+
+    @property
+    def x_vec(self):
+        if self._x_vec is None:
+            return self.x_vec_slice(0, len(self.y_vec))
+        return self._x_vec
+
+    @x_vec.setter
+    def x_vec(self, x_vec):
+        self._x_vec = x_vec
+
+    def x_vec_slice(self, start, stop):
+        if self._x_vec is None:
+            stop = min(stop, len(self.y_vec))
+            return self._start_time + np.arange(start, stop) / self.sample_rate
+        return self._x_vec[start:stop]
+
+    @property
+    def sample_count(self) -> int:
+        return len(self.y_vec)
+
+    @property
+    def channels(self) -> int:
+        return 1 if self.y_vec.ndim == 1 else self.y_vec.shape[1]
+
+    def get_mono(self, start=0, stop=None):
+        # Average of the channels over [start, stop), used for display and the mono fast path
+        y_vec = self.y_vec[start:stop]
+        return y_vec if y_vec.ndim == 1 else y_vec.mean(axis=1)
+
+    @property
+    def start_time(self) -> float:
+        return self._start_time if self._x_vec is None else self._x_vec[0]
+
+    @property
+    def end_time(self) -> float:
+        return self.time_at(len(self.y_vec) - 1)
+
+    def time_at(self, index) -> float:
+        if self._x_vec is None:
+            return self._start_time + index / self.sample_rate
+        return self._x_vec[index]
+
+    def index_at(self, time) -> int:
+        if self._x_vec is None:
+            index = int(np.ceil((time - self._start_time) * self.sample_rate - 1e-9))
+        else:
+            index = int(np.searchsorted(self._x_vec, time))
+        return min(max(index, 0), len(self.y_vec))
+
+    @property
+    def full_scale(self) -> float:
+        # Sample value of a full-scale audio signal, 1 for float audio and 2**(bits - 1) for integer PCM
+        if self.audio is None:
+            return None
+        if getattr(self.audio, 'is_float', False):
+            return 1.0
+        return float(2 ** (8 * self.audio.sample_width - 1))
 
     def get_sampling_frequency(self):
         if self.audio:
             sampling_frequency = self.audio.frame_rate
+        elif self._x_vec is None:
+            sampling_frequency = self.sample_rate
         else:
             time_difference = self.x_vec[1] - self.x_vec[0]
             sampling_frequency = np.ceil(1 / time_difference)
 
         return sampling_frequency
-
-
@@ -0,0 +1,37 @@
+from PyQt6.QtCore import QTimer
+from PyQt6.QtWidgets import QLabel, QSizePolicy
+
+from managers.profiler import Profiler, get_peak_rss
+
+
+class PerformanceOverlay(QLabel):
+    # Status-bar summary of the profiler: median and 95th percentile latency of every section and the
+    # process's peak memory, refreshed twice a second while it is shown
+    def __init__(self, profiler: Profiler, parent=None) -> None:
+        super().__init__(parent)
+        self.profiler = profiler
+        # Long summaries are cut at the window's edge instead of widening it
+        self.setSizePolicy(QSizePolicy.Policy.Ignored, QSizePolicy.Policy.Preferred)
+        self.timer = QTimer(self)
+        self.timer.setInterval(500)
+        self.timer.timeout.connect(self.refresh)
+        self.setVisible(False)
+
+    def setVisible(self, visible: bool):
+        super().setVisible(visible)
+        if visible:
+            self.refresh()
+            self.timer.start()
+        else:
+            self.timer.stop()
+
+    def refresh(self):
+        stats = self.profiler.get_stats()
+        sections = [
+            f"{name} {section['p50_ms']:.1f}/{section['p95_ms']:.1f} ms"
+            for name, section in sorted(stats.items(), key=lambda item: -item[1]['p95_ms'])
+        ]
+        sections.append(f'peak {get_peak_rss() / 1024 ** 2:.0f} MB')
+        self.setText('  |  '.join(sections))
+        tooltip = [f"{name}: {section['count']} calls, max {section['max_ms']:.1f} ms, +{section['peak_memory_growth'] / 1024 ** 2:.0f} MB peak" for name, section in stats.items()]
+        self.setToolTip('\n'.join(['p50/p95 latency of the last calls'] + tooltip))
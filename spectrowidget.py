@@ -1,11 +1,7 @@
 from PyQt6.QtWidgets import*
-from PyQt6.QtCore import Qt
-from PyQt6.QtGui import QColor
 
-
-from matplotlib.backends.backend_qt5agg import FigureCanvas
-
-from matplotlib.figure import Figure
+import numpy as np
+import pyqtgraph as pg
 
 
 class SpectroWidget(QWidget):
@@ -13,14 +9,28 @@ class SpectroWidget(QWidget):
     def __init__(self, parent = None):
         
         QWidget.__init__(self, parent)
-        self.canvas = FigureCanvas(Figure())
+        self.plot_widget = pg.PlotWidget()
         
         vertical_layout = QVBoxLayout()
-        vertical_layout.addWidget(self.canvas)
+        vertical_layout.addWidget(self.plot_widget)
         
-        self.canvas.axes = self.canvas.figure.add_subplot(111)
-        self.canvas.figure.patch.set_facecolor('none')
-        self.canvas.axes.tick_params(axis='x', colors='white')
-        self.canvas.axes.tick_params(axis='y', colors='white')
-        self.canvas.setStyleSheet("background-color:black;")
-        self.setLayout(vertical_layout)
\ No newline at end of file
+        # Spectrograms are drawn as a texture, which is far cheaper to update than a matplotlib redraw
+        self.image_item = pg.ImageItem(axisOrder='row-major', autoDownsample=True)
+        self.image_item.setColorMap(pg.colormap.get('viridis'))
+        self.plot_widget.addItem(self.image_item)
+        self.plot_widget.setBackground('k')
+        self.plot_widget.getAxis('bottom').setTextPen('w')
+        self.plot_widget.getAxis('left').setTextPen('w')
+        self.setLayout(vertical_layout)
+
+    def set_image(self, image, rect, levels=None):
+        # image is (frames, bins) in dB, shown with time on x and frequency on y
+        if levels is None:
+            levels = (np.min(image), np.max(image))
+        self.image_item.setImage(image.T, autoLevels=False, levels=levels)
+        self.image_item.setRect(*rect)
+        self.plot_widget.setXRange(rect[0], rect[0] + rect[2], padding=0)
+        self.plot_widget.setYRange(rect[1], rect[1] + rect[3], padding=0)
+
+    def clear(self):
+        self.image_item.clear()
@@ -0,0 +1,677 @@
+# Form implementation generated from reading ui file 'views/mainwindow.ui'
+#
+# Created by: PyQt6 UI code generator 6.11.0
+#
+# WARNING: Any manual changes made to this file will be lost when pyuic6 is
+# run again.  Do not edit this file unless you know what you are doing.
+
+
+from PyQt6 import QtCore, QtGui, QtWidgets
+
+
+class Ui_MainWindow(object):
+    def setupUi(self, MainWindow):
+        MainWindow.setObjectName("MainWindow")
+        MainWindow.resize(1047, 805)
+        MainWindow.setStyleSheet("QMainWindow {\n"
+"    background-color:#151a1e;\n"
+"}\n"
+"QCalendar {\n"
+"    background-color: #151a1e;\n"
+"}\n"
+"QInputDialog, QDialog {\n"
+"    background-color:#151a1e;\n"
+"}\n"
+"QTextEdit {\n"
+"    border-width: 1px;\n"
+"    border-style: solid;\n"
+"    border-color: #4fa08b;\n"
+"    background-color: #222b2e;\n"
+"    color: #d3dae3;\n"
+"}\n"
+"QFrame {\n"
+"    border-color: gray;  /* Set the border properties for the QFrame */\n"
+"}\n"
+"QPlainTextEdit {\n"
+"    border-width: 1px;\n"
+"    border-style: solid;\n"
+"    border-color: #4fa08b;\n"
+"    background-color: #222b2e;\n"
+"    color: #d3dae3;\n"
+"}\n"
+"QToolButton {\n"
+"    border-style: solid;\n"
+"    border-top-color: qlineargradient(spread:pad, x1:0.5, y1:1, x2:0.5, y2:0, stop:0 rgb(215, 215, 215), stop:1 rgb(222, 222, 222));\n"
+"    border-right-color: qlineargradient(spread:pad, x1:0, y1:0.5, x2:1, y2:0.5, stop:0 rgb(217, 217, 217), stop:1 rgb(227, 227, 227));\n"
+"    border-left-color: qlineargradient(spread:pad, x1:0, y1:0.5, x2:1, y2:0.5, stop:0 rgb(227, 227, 227), stop:1 rgb(217, 217, 217));\n"
+"    border-bottom-color: qlineargradient(spread:pad, x1:0.5, y1:1, x2:0.5, y2:0, stop:0 rgb(215, 215, 215), stop:1 rgb(222, 222, 222));\n"
+"    border-width: 1px;\n"
+"    border-radius: 5px;\n"
+"    color: #d3dae3;\n"
+"    padding: 2px;\n"
+"    background-color: rgb(255,255,255);\n"
+"}\n"
+"QToolButton:hover{\n"
+"    border-style: solid;\n"
+"    border-top-color: qlineargradient(spread:pad, x1:0.5, y1:1, x2:0.5, y2:0, stop:0 rgb(195, 195, 195), stop:1 rgb(222, 222, 222));\n"
+"    border-right-color: qlineargradient(spread:pad, x1:0, y1:0.5, x2:1, y2:0.5, stop:0 rgb(197, 197, 197), stop:1 rgb(227, 227, 227));\n"
+"    border-left-color: qlineargradient(spread:pad, x1:0, y1:0.5, x2:1, y2:0.5, stop:0 rgb(227, 227, 227), stop:1 rgb(197, 197, 197));\n"
+"    border-bottom-color: qlineargradient(spread:pad, x1:0.5, y1:1, x2:0.5, y2:0, stop:0 rgb(195, 195, 195), stop:1 rgb(222, 222, 222));\n"
+"    border-width: 1px;\n"
+"    border-radius: 5px;\n"
+"    color: rgb(0,0,0);\n"
+"    padding: 2px;\n"
+"    background-color: rgb(255,255,255);\n"
+"}\n"
+"QToolButton:pressed{\n"
+"    border-style: solid;\n"
+"    border-top-color: qlineargradient(spread:pad, x1:0.5, y1:1, x2:0.5, y2:0, stop:0 rgb(215, 215, 215), stop:1 rgb(222, 222, 222));\n"
+"    border-right-color: qlineargradient(spread:pad, x1:0, y1:0.5, x2:1, y2:0.5, stop:0 rgb(217, 217, 217), stop:1 rgb(227, 227, 227));\n"
+"    border-left-color: qlineargradient(spread:pad, x1:0, y1:0.5, x2:1, y2:0.5, stop:0 rgb(227, 227, 227), stop:1 rgb(217, 217, 217));\n"
+"    border-bottom-color: qlineargradient(spread:pad, x1:0.5, y1:1, x2:0.5, y2:0, stop:0 rgb(215, 215, 215), stop:1 rgb(222, 222, 222));\n"
+"    border-width: 1px;\n"
+"    border-radius: 5px;\n"
+"    color: rgb(0,0,0);\n"
+"    padding: 2px;\n"
+"    background-color: rgb(142,142,142);\n"
+"}\n"
+"QPushButton{\n"
+"    border-style: solid;\n"
+"    border-color: #050a0e;\n"
+"    border-width: 1px;\n"
+"    border-radius: 5px;\n"
+"    color: #d3dae3;\n"
+"    padding: 2px;\n"
+"    background-color: #151a1e;\n"
+"}\n"
+"QPushButton::default{\n"
+"    border-style: solid;\n"
+"    border-color: #050a0e;\n"
+"    border-width: 1px;\n"
+"    border-radius: 5px;\n"
+"    color: #FFFFFF;\n"
+"    padding: 2px;\n"
+"    background-color: #151a1e;;\n"
+"}\n"
+"QPushButton:hover{\n"
+"    border-style: solid;\n"
+"    border-color: #050a0e;\n"
+"    border-width: 1px;\n"
+"    border-radius: 5px;\n"
+"    color: #d3dae3;\n"
+"    padding: 2px;\n"
+"    background-color: #1c1f1f;\n"
+"}\n"
+"QPushButton:pressed{\n"
+"    border-style: solid;\n"
+"    border-color: #050a0e;\n"
+"    border-width: 1px;\n"
+"    border-radius: 5px;\n"
+"    color: #d3dae3;\n"
+"    padding: 2px;\n"
+"    background-color: #2c2f2f;\n"
+"}\n"
+"QPushButton:disabled{\n"
+"    border-style: solid;\n"
+"    border-top-color: qlineargradient(spread:pad, x1:0.5, y1:1, x2:0.5, y2:0, stop:0 rgb(215, 215, 215), stop:1 rgb(222, 222, 222));\n"
+"    border-right-color: qlineargradient(spread:pad, x1:0, y1:0.5, x2:1, y2:0.5, stop:0 rgb(217, 217, 217), stop:1 rgb(227, 227, 227));\n"
+"    border-left-color: qlineargradient(spread:pad, x1:0, y1:0.5, x2:1, y2:0.5, stop:0 rgb(227, 227, 227), stop:1 rgb(217, 217, 217));\n"
+"    border-bottom-color: qlineargradient(spread:pad, x1:0.5, y1:1, x2:0.5, y2:0, stop:0 rgb(215, 215, 215), stop:1 rgb(222, 222, 222));\n"
+"    border-width: 1px;\n"
+"    border-radius: 5px;\n"
+"    color: #808086;\n"
+"    padding: 2px;\n"
+"    background-color: rgb(142,142,142);\n"
+"}\n"
+"QLineEdit {\n"
+"    border-width: 1px;\n"
+"    border-style: solid;\n"
+"    border-color: #4fa08b;\n"
+"    background-color: #222b2e;\n"
+"    color: #d3dae3;\n"
+"}\n"
+"QLabel {\n"
+"    font-size: 18px;\n"
+"    font-weight: medium;\n"
+"       color: #d3dae3;\n"
+"}\n"
+"QLCDNumber {\n"
+"    color: #4d9b87;\n"
+"}\n"
+"QProgressBar {\n"
+"    text-align: center;\n"
+"    color: #d3dae3;\n"
+"    border-radius: 10px;\n"
+"    border-color: transparent;\n"
+"    border-style: solid;\n"
+"    background-color: #52595d;\n"
+"}\n"
+"QProgressBar::chunk {\n"
+"    background-color: #214037    ;\n"
+"    border-radius: 10px;\n"
+"}\n"
+"QMenuBar {\n"
+"    background-color: #151a1e;\n"
+"}\n"
+"QMenuBar::item {\n"
+"    color: #d3dae3;\n"
+"      spacing: 3px;\n"
+"      padding: 1px 4px;\n"
+"    background-color: #151a1e;\n"
+"}\n"
+"\n"
+"QMenuBar::item:selected {\n"
+"      background-color: #252a2e;\n"
+"    color: #FFFFFF;\n"
+"}\n"
+"QMenu {\n"
+"    background-color: #151a1e;\n"
+"}\n"
+"QMenu::item:selected {\n"
+"    background-color: #252a2e;\n"
+"    color: #FFFFFF;\n"
+"}\n"
+"QMenu::item {\n"
+"    color: #d3dae3;\n"
+"    background-color: #151a1e;\n"
+"}\n"
+"QTabWidget {\n"
+"    color:rgb(0,0,0);\n"
+"    background-color:#000000;\n"
+"}\n"
+"QTabWidget::pane {\n"
+"        border-color: #050a0e;\n"
+"        background-color: #1e282c;\n"
+"        border-style: solid;\n"
+"        border-width: 1px;\n"
+"        border-bottom-left-radius: 4px;\n"
+"        border-bottom-right-radius: 4px;\n"
+"}\n"
+"QTabBar::tab:first {\n"
+"    border-style: solid;\n"
+"    border-left-width:1px;\n"
+"    border-right-width:0px;\n"
+"    border-top-width:1px;\n"
+"    border-bottom-width:0px;\n"
+"    border-top-color: #050a0e;\n"
+"    border-left-color: #050a0e;\n"
+"    border-bottom-color: #050a0e;\n"
+"    border-top-left-radius: 4px;\n"
+"    color: #d3dae3;\n"
+"    padding: 3px;\n"
+"    margin-left:0px;\n"
+"    background-color: #151a1e;\n"
+"}\n"
+"QTabBar::tab:last {\n"
+"    border-style: solid;\n"
+"    border-top-width:1px;\n"
+"    border-left-width:1px;\n"
+"    border-right-width:1px;\n"
+"    border-bottom-width:0px;\n"
+"    border-color: #050a0e;\n"
+"    border-top-right-radius: 4px;\n"
+"    color: #d3dae3;\n"
+"    padding: 3px;\n"
+"    margin-left:0px;\n"
+"    background-color: #151a1e;\n"
+"}\n"
+"QTabBar::tab {\n"
+"    border-style: solid;\n"
+"    border-top-width:1px;\n"
+"    border-bottom-width:0px;\n"
+"    border-left-width:1px;\n"
+"    border-top-color: #050a0e;\n"
+"    border-left-color: #050a0e;\n"
+"    border-bottom-color: #050a0e;\n"
+"    color: #d3dae3;\n"
+"    padding: 3px;\n"
+"    margin-left:0px;\n"
+"    background-color: #151a1e;\n"
+"}\n"
+"QTabBar::tab:selected, QTabBar::tab:last:selected, QTabBar::tab:hover {\n"
+"      border-style: solid;\n"
+"      border-left-width:1px;\n"
+"    border-bottom-width:0px;\n"
+"    border-right-color: transparent;\n"
+"    border-top-color: #050a0e;\n"
+"    border-left-color: #050a0e;\n"
+"    border-bottom-color: #050a0e;\n"
+"    color: #FFFFFF;\n"
+"    padding: 3px;\n"
+"    margin-left:0px;\n"
+"    background-color: #1e282c;\n"
+"}\n"
+"\n"
+"QTabBar::tab:selected, QTabBar::tab:first:selected, QTabBar::tab:hover {\n"
+"      border-style: solid;\n"
+"      border-left-width:1px;\n"
+"      border-bottom-width:0px;\n"
+"      border-top-width:1px;\n"
+"    border-right-color: transparent;\n"
+"    border-top-color: #050a0e;\n"
+"    border-left-color: #050a0e;\n"
+"    border-bottom-color: #050a0e;\n"
+"    color: #FFFFFF;\n"
+"    padding: 3px;\n"
+"    margin-left:0px;\n"
+"    background-color: #1e282c;\n"
+"}\n"
+"\n"
+"QCheckBox {\n"
+"    color: #d3dae3;\n"
+"    padding: 2px;\n"
+"}\n"
+"QCheckBox:disabled {\n"
+"    color: #808086;\n"
+"    padding: 2px;\n"
+"}\n"
+"\n"
+"QCheckBox:hover {\n"
+"    border-radius:4px;\n"
+"    border-style:solid;\n"
+"    padding-left: 1px;\n"
+"    padding-right: 1px;\n"
+"    padding-bottom: 1px;\n"
+"    padding-top: 1px;\n"
+"    border-width:1px;\n"
+"    border-color: transparent;\n"
+"}\n"
+"QCheckBox::indicator:checked {\n"
+"\n"
+"    height: 10px;\n"
+"    width: 10px;\n"
+"    border-style:solid;\n"
+"    border-width: 1px;\n"
+"    border-color: #4fa08b;\n"
+"    color: #000000;\n"
+"    background-color: qradialgradient(cx:0.4, cy:0.4, radius: 1.5,fx:0, fy:0, stop:0 #1e282c, stop:0.3 #1e282c, stop:0.4 #4fa08b, stop:0.5 #1e282c, stop:1 #1e282c);\n"
+"}\n"
+"QCheckBox::indicator:unchecked {\n"
+"\n"
+"    height: 10px;\n"
+"    width: 10px;\n"
+"    border-style:solid;\n"
+"    border-width: 1px;\n"
+"    border-color: #4fa08b;\n"
+"    color: #000000;\n"
+"}\n"
+"QRadioButton {\n"
+"    color: #d3dae3;\n"
+"    padding: 1px;\n"
+"}\n"
+"QRadioButton::indicator:checked {\n"
+"    height: 10px;\n"
+"    width: 10px;\n"
+"    border-style:solid;\n"
+"    border-radius:5px;\n"
+"    border-width: 1px;\n"
+"    border-color: #4fa08b;\n"
+"    color: #a9b7c6;\n"
+"    background-color: qradialgradient(cx:0.5, cy:0.5, radius:0.4,fx:0.5, fy:0.5, stop:0 #4fa08b, stop:1 #1e282c);\n"
+"}\n"
+"QRadioButton::indicator:!checked {\n"
+"    height: 10px;\n"
+"    width: 10px;\n"
+"    border-style:solid;\n"
+"    border-radius:5px;\n"
+"    border-width: 1px;\n"
+"    border-color: #4fa08b;\n"
+"    color: #a9b7c6;\n"
+"    background-color: transparent;\n"
+"}\n"
+"QStatusBar {\n"
+"    color:#027f7f;\n"
+"}\n"
+"QSpinBox {\n"
+"    color: #d3dae3;\n"
+"    background-color: #222b2e;\n"
+"    border-width: 1px;\n"
+"    border-style: solid;\n"
+"    border-color: #4fa08b;\n"
+"}\n"
+"QDoubleSpinBox {\n"
+"    color: #d3dae3;\n"
+"    background-color: #222b2e;\n"
+"    border-width: 1px;\n"
+"    border-style: solid;\n"
+"    border-color: #4fa08b;\n"
+"}\n"
+"QTimeEdit {\n"
+"    color: #d3dae3;\n"
+"    background-color: #222b2e;\n"
+"    border-width: 1px;\n"
+"    border-style: solid;\n"
+"    border-color: #4fa08b;\n"
+"}\n"
+"QDateTimeEdit {\n"
+"    color: #d3dae3;\n"
+"    background-color: #222b2e;\n"
+"    border-width: 1px;\n"
+"    border-style: solid;\n"
+"    border-color: #4fa08b;\n"
+"}\n"
+"QDateEdit {\n"
+"    color: #d3dae3;\n"
+"    background-color: #222b2e;\n"
+"    border-width: 1px;\n"
+"    border-style: solid;\n"
+"    border-color: #4fa08b;\n"
+"}\n"
+"QFontComboBox {\n"
+"    color: #d3dae3;\n"
+"    background-color: #222b2e;\n"
+"    border-width: 1px;\n"
+"    border-style: solid;\n"
+"    border-color: #4fa08b;\n"
+"}\n"
+"QComboBox {\n"
+"    color: #d3dae3;\n"
+"    background-color: #222b2e;\n"
+"    border-width: 1px;\n"
+"    border-style: solid;\n"
+"    border-color: #4fa08b;\n"
+"}\n"
+"\n"
+"QDial {\n"
+"    background: #16a085;\n"
+"}\n"
+"\n"
+"QToolBox {\n"
+"    color: #a9b7c6;\n"
+"    background-color: #222b2e;\n"
+"}\n"
+"QToolBox::tab {\n"
+"    color: #a9b7c6;\n"
+"    background-color:#222b2e;\n"
+"}\n"
+"QToolBox::tab:selected {\n"
+"    color: #FFFFFF;\n"
+"    background-color:#222b2e;\n"
+"}\n"
+"QScrollArea {\n"
+"    color: #FFFFFF;\n"
+"    background-color:#222b2e;\n"
+"}\n"
+"QSlider::groove:horizontal {\n"
+"    height: 5px;\n"
+"    background-color: #52595d;\n"
+"}\n"
+"QSlider::groove:vertical {\n"
+"    width: 5px;\n"
+"    background-color: #52595d;\n"
+"}\n"
+"QSlider::handle:horizontal {\n"
+"    background: #1a2224;\n"
+"    border-style: solid;\n"
+"    border-width: 1px;\n"
+"    border-color: rgb(207,207,207);\n"
+"    width: 12px;\n"
+"    margin: -5px 0;\n"
+"    border-radius: 7px;\n"
+"}\n"
+"QSlider::handle:vertical {\n"
+"    background: #1a2224;\n"
+"    border-style: solid;\n"
+"    border-width: 1px;\n"
+"    border-color: rgb(207,207,207);\n"
+"    height: 12px;\n"
+"    margin: 0 -5px;\n"
+"    border-radius: 7px;\n"
+"}\n"
+"QSlider::add-page:horizontal {\n"
+"    background: #52595d;\n"
+"}\n"
+"QSlider::add-page:vertical {\n"
+"    background: #52595d;\n"
+"}\n"
+"QSlider::sub-page:horizontal {\n"
+"    background-color: #15433a;\n"
+"}\n"
+"QSlider::sub-page:vertical {\n"
+"    background-color: #15433a;\n"
+"}\n"
+"QScrollBar:horizontal {\n"
+"    max-height: 10px;\n"
+"    border: 1px transparent grey;\n"
+"    margin: 0px 20px 0px 20px;\n"
+"    background: transparent;\n"
+"}\n"
+"QScrollBar:vertical {\n"
+"    max-width: 10px;\n"
+"    border: 1px transparent grey;\n"
+"    margin: 20px 0px 20px 0px;\n"
+"    background: transparent;\n"
+"}\n"
+"QScrollBar::handle:horizontal {\n"
+"    background: #52595d;\n"
+"    border-style: transparent;\n"
+"    border-radius: 4px;\n"
+"    min-width: 25px;\n"
+"}\n"
+"QListWidget {\n"
+"    background-color: black;\n"
+"    color: white; /* Set text color to white for better visibility */\n"
+"}\n"
+"QlistView{\n"
+"    background-color: black;\n"
+"}")
+        self.centralwidget = QtWidgets.QWidget(parent=MainWindow)
+        self.centralwidget.setObjectName("centralwidget")
+        self.horizontalLayout_7 = QtWidgets.QHBoxLayout(self.centralwidget)
+        self.horizontalLayout_7.setObjectName("horizontalLayout_7")
+        self.verticalLayout_4 = QtWidgets.QVBoxLayout()
+        self.verticalLayout_4.setSizeConstraint(QtWidgets.QLayout.SizeConstraint.SetMinimumSize)
+        self.verticalLayout_4.setObjectName("verticalLayout_4")
+        self.rectangle_button = QtWidgets.QPushButton(parent=self.centralwidget)
+        self.rectangle_button.setMinimumSize(QtCore.QSize(0, 50))
+        self.rectangle_button.setObjectName("rectangle_button")
+        self.verticalLayout_4.addWidget(self.rectangle_button)
+        self.hamming_button = QtWidgets.QPushButton(parent=self.centralwidget)
+        self.hamming_button.setMinimumSize(QtCore.QSize(0, 50))
+        self.hamming_button.setObjectName("hamming_button")
+        self.verticalLayout_4.addWidget(self.hamming_button)
+        self.hanning_button = QtWidgets.QPushButton(parent=self.centralwidget)
+        self.hanning_button.setMinimumSize(QtCore.QSize(0, 50))
+        self.hanning_button.setObjectName("hanning_button")
+        self.verticalLayout_4.addWidget(self.hanning_button)
+        self.gaussian_button = QtWidgets.QPushButton(parent=self.centralwidget)
+        self.gaussian_button.setMinimumSize(QtCore.QSize(0, 50))
+        self.gaussian_button.setCheckable(False)
+        self.gaussian_button.setChecked(False)
+        self.gaussian_button.setFlat(False)
+        self.gaussian_button.setObjectName("gaussian_button")
+        self.verticalLayout_4.addWidget(self.gaussian_button)
+        spacerItem = QtWidgets.QSpacerItem(20, 400, QtWidgets.QSizePolicy.Policy.Minimum, QtWidgets.QSizePolicy.Policy.Fixed)
+        self.verticalLayout_4.addItem(spacerItem)
+        self.horizontalLayout_7.addLayout(self.verticalLayout_4)
+        self.line = QtWidgets.QFrame(parent=self.centralwidget)
+        self.line.setFrameShape(QtWidgets.QFrame.Shape.VLine)
+        self.line.setFrameShadow(QtWidgets.QFrame.Shadow.Sunken)
+        self.line.setObjectName("line")
+        self.horizontalLayout_7.addWidget(self.line)
+        self.verticalLayout_9 = QtWidgets.QVBoxLayout()
+        self.verticalLayout_9.setObjectName("verticalLayout_9")
+        self.horizontalLayout_6 = QtWidgets.QHBoxLayout()
+        self.horizontalLayout_6.setObjectName("horizontalLayout_6")
+        self.verticalLayout = QtWidgets.QVBoxLayout()
+        self.verticalLayout.setObjectName("verticalLayout")
+        self.input_signal_graph = PlotWidget(parent=self.centralwidget)
+        self.input_signal_graph.setMinimumSize(QtCore.QSize(0, 0))
+        self.input_signal_graph.setMaximumSize(QtCore.QSize(16777215, 16777215))
+        self.input_signal_graph.setObjectName("input_signal_graph")
+        self.verticalLayout.addWidget(self.input_signal_graph)
+        self.input_slider = QtWidgets.QSlider(parent=self.centralwidget)
+        self.input_slider.setOrientation(QtCore.Qt.Orientation.Horizontal)
+        self.input_slider.setObjectName("input_slider")
+        self.verticalLayout.addWidget(self.input_slider)
+        self.horizontalLayout_9 = QtWidgets.QHBoxLayout()
+        self.horizontalLayout_9.setObjectName("horizontalLayout_9")
+        self.input_play_button = QtWidgets.QPushButton(parent=self.centralwidget)
+        self.input_play_button.setMinimumSize(QtCore.QSize(0, 40))
+        self.input_play_button.setMaximumSize(QtCore.QSize(80, 16777215))
+        self.input_play_button.setObjectName("input_play_button")
+        self.horizontalLayout_9.addWidget(self.input_play_button)
+        self.current_input_time = QtWidgets.QLabel(parent=self.centralwidget)
+        self.current_input_time.setObjectName("current_input_time")
+        self.horizontalLayout_9.addWidget(self.current_input_time)
+        self.input_total_time = QtWidgets.QLabel(parent=self.centralwidget)
+        self.input_total_time.setAlignment(QtCore.Qt.AlignmentFlag.AlignRight|QtCore.Qt.AlignmentFlag.AlignTrailing|QtCore.Qt.AlignmentFlag.AlignVCenter)
+        self.input_total_time.setObjectName("input_total_time")
+        self.horizontalLayout_9.addWidget(self.input_total_time)
+        self.verticalLayout.addLayout(self.horizontalLayout_9)
+        self.horizontalLayout_2 = QtWidgets.QHBoxLayout()
+        self.horizontalLayout_2.setObjectName("horizontalLayout_2")
+        spacerItem1 = QtWidgets.QSpacerItem(40, 20, QtWidgets.QSizePolicy.Policy.Expanding, QtWidgets.QSizePolicy.Policy.Minimum)
+        self.horizontalLayout_2.addItem(spacerItem1)
+        self.verticalLayout.addLayout(self.horizontalLayout_2)
+        self.horizontalLayout_6.addLayout(self.verticalLayout)
+        self.input_spectrogram_graph = SpectroWidget(parent=self.centralwidget)
+        self.input_spectrogram_graph.setMinimumSize(QtCore.QSize(0, 0))
+        self.input_spectrogram_graph.setMaximumSize(QtCore.QSize(16777213, 500))
+        self.input_spectrogram_graph.setStyleSheet("SpectroWidget{\n"
+"background-color:#000000;\n"
+"}")
+        self.input_spectrogram_graph.setObjectName("input_spectrogram_graph")
+        self.horizontalLayout_6.addWidget(self.input_spectrogram_graph)
+        self.verticalLayout_9.addLayout(self.horizontalLayout_6)
+        self.horizontalLayout = QtWidgets.QHBoxLayout()
+        self.horizontalLayout.setObjectName("horizontalLayout")
+        self.verticalLayout_2 = QtWidgets.QVBoxLayout()
+        self.verticalLayout_2.setObjectName("verticalLayout_2")
+        self.output_signal_graph = PlotWidget(parent=self.centralwidget)
+        self.output_signal_graph.setMinimumSize(QtCore.QSize(0, 0))
+        self.output_signal_graph.setMaximumSize(QtCore.QSize(16777215, 16777215))
+        self.output_signal_graph.setObjectName("output_signal_graph")
+        self.verticalLayout_2.addWidget(self.output_signal_graph)
+        self.output_slider = QtWidgets.QSlider(parent=self.centralwidget)
+        self.output_slider.setOrientation(QtCore.Qt.Orientation.Horizontal)
+        self.output_slider.setObjectName("output_slider")
+        self.verticalLayout_2.addWidget(self.output_slider)
+        self.horizontalLayout_4 = QtWidgets.QHBoxLayout()
+        self.horizontalLayout_4.setObjectName("horizontalLayout_4")
+        self.output_play_button = QtWidgets.QPushButton(parent=self.centralwidget)
+        self.output_play_button.setMinimumSize(QtCore.QSize(0, 40))
+        self.output_play_button.setMaximumSize(QtCore.QSize(80, 16777215))
+        self.output_play_button.setObjectName("output_play_button")
+        self.horizontalLayout_4.addWidget(self.output_play_button)
+        self.current_output_time = QtWidgets.QLabel(parent=self.centralwidget)
+        self.current_output_time.setObjectName("current_output_time")
+        self.horizontalLayout_4.addWidget(self.current_output_time)
+        self.output_total_time = QtWidgets.QLabel(parent=self.centralwidget)
+        self.output_total_time.setAlignment(QtCore.Qt.AlignmentFlag.AlignRight|QtCore.Qt.AlignmentFlag.AlignTrailing|QtCore.Qt.AlignmentFlag.AlignVCenter)
+        self.output_total_time.setObjectName("output_total_time")
+        self.horizontalLayout_4.addWidget(self.output_total_time)
+        self.verticalLayout_2.addLayout(self.horizontalLayout_4)
+        self.horizontalLayout_3 = QtWidgets.QHBoxLayout()
+        self.horizontalLayout_3.setObjectName("horizontalLayout_3")
+        spacerItem2 = QtWidgets.QSpacerItem(40, 20, QtWidgets.QSizePolicy.Policy.Expanding, QtWidgets.QSizePolicy.Policy.Minimum)
+        self.horizontalLayout_3.addItem(spacerItem2)
+        self.verticalLayout_2.addLayout(self.horizontalLayout_3)
+        self.horizontalLayout.addLayout(self.verticalLayout_2)
+        self.output_spectrogram_graph = SpectroWidget(parent=self.centralwidget)
+        self.output_spectrogram_graph.setMinimumSize(QtCore.QSize(0, 0))
+        self.output_spectrogram_graph.setMaximumSize(QtCore.QSize(16777213, 500))
+        self.output_spectrogram_graph.setObjectName("output_spectrogram_graph")
+        self.horizontalLayout.addWidget(self.output_spectrogram_graph)
+        self.verticalLayout_9.addLayout(self.horizontalLayout)
+        self.verticalLayout_3 = QtWidgets.QVBoxLayout()
+        self.verticalLayout_3.setObjectName("verticalLayout_3")
+        self.frequency_graph = PlotWidget(parent=self.centralwidget)
+        self.frequency_graph.setMinimumSize(QtCore.QSize(0, 200))
+        self.frequency_graph.setMaximumSize(QtCore.QSize(16777215, 16777215))
+        self.frequency_graph.setObjectName("frequency_graph")
+        self.verticalLayout_3.addWidget(self.frequency_graph)
+        self.widget = QtWidgets.QWidget(parent=self.centralwidget)
+        self.widget.setMinimumSize(QtCore.QSize(0, 150))
+        self.widget.setObjectName("widget")
+        self.horizontalLayout_8 = QtWidgets.QHBoxLayout(self.widget)
+        self.horizontalLayout_8.setObjectName("horizontalLayout_8")
+        self.sliders_layout = QtWidgets.QHBoxLayout()
+        self.sliders_layout.setObjectName("sliders_layout")
+        self.horizontalLayout_8.addLayout(self.sliders_layout)
+        self.verticalLayout_3.addWidget(self.widget)
+        self.verticalLayout_9.addLayout(self.verticalLayout_3)
+        self.horizontalLayout_7.addLayout(self.verticalLayout_9)
+        MainWindow.setCentralWidget(self.centralwidget)
+        self.menubar = QtWidgets.QMenuBar(parent=MainWindow)
+        self.menubar.setGeometry(QtCore.QRect(0, 0, 1047, 23))
+        self.menubar.setObjectName("menubar")
+        self.menuFile = QtWidgets.QMenu(parent=self.menubar)
+        self.menuFile.setObjectName("menuFile")
+        self.menuMode = QtWidgets.QMenu(parent=self.menubar)
+        self.menuMode.setObjectName("menuMode")
+        self.menuView = QtWidgets.QMenu(parent=self.menubar)
+        self.menuView.setObjectName("menuView")
+        MainWindow.setMenuBar(self.menubar)
+        self.statusbar = QtWidgets.QStatusBar(parent=MainWindow)
+        self.statusbar.setObjectName("statusbar")
+        MainWindow.setStatusBar(self.statusbar)
+        self.import_action = QtGui.QAction(parent=MainWindow)
+        self.import_action.setObjectName("import_action")
+        self.export_action = QtGui.QAction(parent=MainWindow)
+        self.export_action.setObjectName("export_action")
+        self.performance_overlay_action = QtGui.QAction(parent=MainWindow)
+        self.performance_overlay_action.setCheckable(True)
+        self.performance_overlay_action.setObjectName("performance_overlay_action")
+        self.dump_trace_action = QtGui.QAction(parent=MainWindow)
+        self.dump_trace_action.setObjectName("dump_trace_action")
+        self.play_pause_1_action = QtGui.QAction(parent=MainWindow)
+        self.play_pause_1_action.setObjectName("play_pause_1_action")
+        self.play_pause_2_action = QtGui.QAction(parent=MainWindow)
+        self.play_pause_2_action.setObjectName("play_pause_2_action")
+        self.uniform_range_action = QtGui.QAction(parent=MainWindow)
+        self.uniform_range_action.setObjectName("uniform_range_action")
+        self.musical_instruments_action = QtGui.QAction(parent=MainWindow)
+        self.musical_instruments_action.setObjectName("musical_instruments_action")
+        self.animal_sounds_action = QtGui.QAction(parent=MainWindow)
+        self.animal_sounds_action.setObjectName("animal_sounds_action")
+        self.ecg_abnormalities_action = QtGui.QAction(parent=MainWindow)
+        self.ecg_abnormalities_action.setObjectName("ecg_abnormalities_action")
+        self.delete_action = QtGui.QAction(parent=MainWindow)
+        self.delete_action.setObjectName("delete_action")
+        self.menuFile.addAction(self.import_action)
+        self.menuFile.addAction(self.export_action)
+        self.menuFile.addAction(self.delete_action)
+        self.menuMode.addAction(self.uniform_range_action)
+        self.menuMode.addAction(self.musical_instruments_action)
+        self.menuMode.addAction(self.animal_sounds_action)
+        self.menuMode.addAction(self.ecg_abnormalities_action)
+        self.menuView.addAction(self.performance_overlay_action)
+        self.menuView.addAction(self.dump_trace_action)
+        self.menubar.addAction(self.menuFile.menuAction())
+        self.menubar.addAction(self.menuMode.menuAction())
+        self.menubar.addAction(self.menuView.menuAction())
+
+        self.retranslateUi(MainWindow)
+        QtCore.QMetaObject.connectSlotsByName(MainWindow)
+
+    def retranslateUi(self, MainWindow):
+        _translate = QtCore.QCoreApplication.translate
+        MainWindow.setWindowTitle(_translate("MainWindow", "MainWindow"))
+        self.rectangle_button.setText(_translate("MainWindow", "Rectangle"))
+        self.hamming_button.setText(_translate("MainWindow", "Hamming"))
+        self.hanning_button.setText(_translate("MainWindow", "Hanning"))
+        self.gaussian_button.setText(_translate("MainWindow", "Gaussian"))
+        self.input_play_button.setText(_translate("MainWindow", "Play"))
+        self.current_input_time.setText(_translate("MainWindow", "00:00"))
+        self.input_total_time.setText(_translate("MainWindow", "00:00"))
+        self.output_play_button.setText(_translate("MainWindow", "Play"))
+        self.current_output_time.setText(_translate("MainWindow", "00:00"))
+        self.output_total_time.setText(_translate("MainWindow", "00:00"))
+        self.menuFile.setTitle(_translate("MainWindow", "File"))
+        self.menuMode.setTitle(_translate("MainWindow", "Mode"))
+        self.menuView.setTitle(_translate("MainWindow", "View"))
+        self.import_action.setText(_translate("MainWindow", "Import"))
+        self.export_action.setText(_translate("MainWindow", "Export output"))
+        self.performance_overlay_action.setText(_translate("MainWindow", "Performance overlay"))
+        self.performance_overlay_action.setShortcut(_translate("MainWindow", "F12"))
+        self.dump_trace_action.setText(_translate("MainWindow", "Dump performance trace..."))
+        self.play_pause_1_action.setText(_translate("MainWindow", "Play/Pause"))
+        self.play_pause_2_action.setText(_translate("MainWindow", "Play/Pause"))
+        self.uniform_range_action.setText(_translate("MainWindow", "Uniform Range"))
+        self.musical_instruments_action.setText(_translate("MainWindow", "Musical Instruments"))
+        self.animal_sounds_action.setText(_translate("MainWindow", "Animal Sounds"))
+        self.ecg_abnormalities_action.setText(_translate("MainWindow", "ECG Abnormalities"))
+        self.delete_action.setText(_translate("MainWindow", "Delete signal"))
+from pyqtgraph import PlotWidget
+from spectrowidget import SpectroWidget